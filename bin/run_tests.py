@@ -1,8 +1,25 @@
+from importlib.util import find_spec
+from pathlib import Path
+import sys
 import unittest
 
 import context
-from datatube.test import *
+
+
+TEST_DIR = Path(__file__).resolve().parent.parent / "datatube" / "test"
 
 
 if __name__ == "__main__":
-    unittest.main()
+    if find_spec("pytest") is None:  # fall back to the standard library
+        # discover each *_test.py module once, rather than re-exporting test
+        # classes from the package (which discovery then collects twice)
+        unittest.main(module=None,
+                      argv=[sys.argv[0], "discover", "-s", str(TEST_DIR),
+                            "-p", "*_test.py", "-t", str(TEST_DIR.parents[1]),
+                            *sys.argv[1:]])
+    else:
+        import pytest
+        args = sys.argv[1:] or [str(TEST_DIR)]
+        if find_spec("xdist") is not None:  # spread tests across all cores
+            args = ["-n", "auto", *args]
+        sys.exit(pytest.main(args))
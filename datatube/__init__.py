@@ -11,7 +11,8 @@ def is_channel_id(id_str: str) -> bool:
 
 
 def is_readable(path: Path) -> bool:
-    return path.is_dir() and len(path.glob("info.json")) > 0
+    # a single stat - Path.glob() is a lazy directory scan with no len()
+    return Path(path, "info.json").is_file()
 
 
 def is_video_id(id_str: str) -> bool:
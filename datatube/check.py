@@ -1,6 +1,8 @@
 from __future__ import annotations
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
+import stat
 
 from datatube import AVAILABLE_SOURCES
 from datatube.error import error_trace
@@ -8,6 +10,10 @@ from datatube.error import error_trace
 import validators
 
 
+# membership tests only - error messages show the ordered tuple
+_SOURCES = frozenset(AVAILABLE_SOURCES)
+
+
 ##############################
 ####    BOOLEAN CHECKS    ####
 ##############################
@@ -18,10 +24,14 @@ def is_channel_id(id_str: str) -> bool:
 
 
 def is_readable(path: Path) -> bool:
-    return path.is_dir() and len(path.glob("info.json")) > 0
+    # a single stat - Path.glob() is a lazy directory scan with no len()
+    return Path(path, "info.json").is_file()
 
 
+@lru_cache(maxsize=256)
 def is_url(url_str: str) -> bool:
+    # validators compiles its pattern once, but its decorator wraps every
+    # call in argument introspection - the same URLs are checked repeatedly
     result = validators.url(url_str)
     return not isinstance(result, validators.ValidationFailure)
 
@@ -34,120 +44,128 @@ def is_video_id(id_str: str) -> bool:
 ############################
 
 
+def _failure(exc_type: type, err_msg: str, context: str) -> Exception:
+    # error_trace() walks the stack, so only pay for it once a check fails.
+    # index 3 skips this helper and the check itself to reach the setter
+    trace = error_trace(stack_index=3)
+    return exc_type(f"[{trace}] {err_msg} {context}")
+
+
 def channel_html(value: dict[str, str], err_msg: str) -> dict[str, str]:
-    trace = f"[{error_trace(stack_index=2)}]"
     if not isinstance(value, dict):
         context = f"(received object of type: {type(value)})"
-        raise TypeError(f"{trace} {err_msg} {context}")
+        raise _failure(TypeError, err_msg, context)
     for k, v in value.items():
         if not isinstance(k, str):
             context = f"(received key of type: {type(k)})"
-            raise TypeError(f"{trace} {err_msg} {context}")
+            raise _failure(TypeError, err_msg, context)
         if not isinstance(v, str):
             context = f"(received value of type: {type(v)} for key: {repr(k)})"
-            raise TypeError(f"{trace} {err_msg} {context}")
+            raise _failure(TypeError, err_msg, context)
     return value
 
 
 def channel_id(value: str, err_msg: str) -> str:
-    trace = f"[{error_trace(stack_index=2)}]"
     if not isinstance(value, str):
         context = (f"(received object of type: {type(value)})")
-        raise TypeError(f"{trace} {err_msg} {context}")
+        raise _failure(TypeError, err_msg, context)
     if not is_channel_id(value):
         context = (f"(received: {repr(value)})")
-        raise ValueError(f"{trace} {err_msg} {context}")
+        raise _failure(ValueError, err_msg, context)
     return value
 
 
 def duration(value: timedelta, err_msg: str) -> timedelta:
-    trace = f"[{error_trace(stack_index=2)}]"
     if not isinstance(value, timedelta):
         context = f"(received object of type: {type(value)})"
-        raise TypeError(f"{trace} {err_msg} {context}")
+        raise _failure(TypeError, err_msg, context)
     if value < timedelta():
         context = f"({value} < {timedelta()})"
-        raise ValueError(f"{trace} {err_msg} {context}")
+        raise _failure(ValueError, err_msg, context)
     return value
 
 
 def positive_int(value: int, err_msg: str) -> int:
-    trace = f"[{error_trace(stack_index=2)}]"
     if not isinstance(value, int):
         context = f"(received object of type: {type(value)})"
-        raise TypeError(f"{trace} {err_msg} {context}")
+        raise _failure(TypeError, err_msg, context)
     if value <= 0:
         context = f"(received: {value})"
-        raise ValueError(f"{trace} {err_msg} {context}")
+        raise _failure(ValueError, err_msg, context)
     return value
 
 
 def source(value: str, err_msg: str) -> str:
-    trace = f"[{error_trace(stack_index=2)}]"
     if not isinstance(value, str):
         context = f"(received object of type: {type(value)})"
-        raise TypeError(f"{trace} {err_msg} {context}")
-    if value not in AVAILABLE_SOURCES:
+        raise _failure(TypeError, err_msg, context)
+    if value not in _SOURCES:
         context = f"(received: {repr(value)})"
-        raise ValueError(f"{trace} {err_msg} {context}")
+        raise _failure(ValueError, err_msg, context)
     return value
 
 
 def str_not_empty(value: str, err_msg: str) -> str:
-    trace = f"[{error_trace(stack_index=2)}]"
     if not isinstance(value, str):
         context = f"(received object of type: {type(value)})"
-        raise TypeError(f"{trace} {err_msg} {context}")
+        raise _failure(TypeError, err_msg, context)
     if not value:  # value is empty string
         context = f"(received: {repr(value)})"
-        raise ValueError(f"{trace} {err_msg} {context}")
+        raise _failure(ValueError, err_msg, context)
     return value
 
 
 def target_dir(value: Path, err_msg: str) -> Path:
-    trace = f"[{error_trace(stack_index=2)}]"
     if not isinstance(value, Path):
         context = f"(received object of type: {type(value)})"
-        raise TypeError(f"{trace} {err_msg} {context}")
-    if value.exists() and not value.is_dir():
+        raise _failure(TypeError, err_msg, context)
+    # one stat() instead of exists() followed by is_dir()
+    try:
+        mode = value.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        return value  # nothing there yet
+    if not stat.S_ISDIR(mode):
         context = f"(path points to file: {value})"
-        raise ValueError(f"{trace} {err_msg} {context}")
+        raise _failure(ValueError, err_msg, context)
     return value
 
 
 def timestamp(value: datetime, err_msg: str) -> datetime:
-    trace = f"[{error_trace(stack_index=2)}]"
     if not isinstance(value, datetime):
         context = f"(received object of type: {type(value)})"
-        raise TypeError(f"{trace} {err_msg} {context}")
-    if value > datetime.now():
-        context = f"(timestamp in the future: {value} > {datetime.now()})"
-        raise ValueError(f"{trace} {err_msg} {context}")
+        raise _failure(TypeError, err_msg, context)
+    now = datetime.now()  # one clock reading for the test and the message
+    if value > now:
+        context = f"(timestamp in the future: {value} > {now})"
+        raise _failure(ValueError, err_msg, context)
     return value
 
 
 def video_id(value: str, err_msg: str) -> str:
-    trace = f"[{error_trace(stack_index=2)}]"
     if not isinstance(value, str):
         context = f"(received object of type: {type(value)})"
-        raise TypeError(f"{trace} {err_msg} {context}")
+        raise _failure(TypeError, err_msg, context)
     if not is_video_id(value):
         context = f"(received: {repr(value)})"
-        raise ValueError(f"{trace} {err_msg} {context}")
+        raise _failure(ValueError, err_msg, context)
     return value
 
 
 def video_id_list(value: list[str] | tuple[str] | set[str],
                   err_msg: str) -> list[str]:
-    trace = f"[{error_trace(stack_index=2)}]"
     if not isinstance(value, (list, tuple, set)):
         context = f"(received object of type: {type(value)})"
-        raise TypeError(f"{trace} {err_msg} {context}")
-    for v_id in value:
+        raise _failure(TypeError, err_msg, context)
+    ids = list(value)
+    # common case: one C-level pass over the types and one over the lengths.
+    # Only fall back to walking ids in Python to report the first bad one
+    if set(map(type, ids)) <= {str} and set(map(len, ids)) <= {11}:
+        return ids
+    for v_id in ids:
         if not isinstance(v_id, str):
             context = f"(received id of type: {type(v_id)})"
-            raise TypeError(f"{trace} {err_msg} {context}")
+            raise _failure(TypeError, err_msg, context)
         if not is_video_id(v_id):
             context = f"(encountered malformed video id: {repr(v_id)})"
-            raise ValueError(f"{trace} {err_msg} {context}")
-    return list(value)
+            raise _failure(ValueError, err_msg, context)
+    return ids
@@ -15,10 +15,15 @@ def error_trace(self_name: str = "self",
     add diagnostic information to an error message, to better facilitate
     logging and debugging.
     """
-    stack = inspect.stack()
-    if len(stack) < stack_index + 1:
+    # walk f_back directly - inspect.stack() builds a FrameInfo (and reads a
+    # line of source) for every frame on the stack just to index one of them
+    parentframe = inspect.currentframe()
+    for _ in range(stack_index):
+        if parentframe is None:
+            break
+        parentframe = parentframe.f_back
+    if parentframe is None:
         return ""
-    parentframe = stack[stack_index][0]
     name = []
 
     # get module name (if applicable)
@@ -40,5 +45,5 @@ def error_trace(self_name: str = "self",
         name.append(callable_name)
 
     # avoid circular refs and frame leaks
-    del parentframe, stack
+    del parentframe
     return ".".join(name)
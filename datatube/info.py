@@ -1,7 +1,9 @@
 from __future__ import annotations
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import json
 from pathlib import Path
+import re
 import reprlib
 from typing import Any, Iterable, Iterator
 
@@ -10,9 +12,16 @@ import validators
 from datatube.error import error_trace
 
 
+@lru_cache(maxsize=None)
+def _property_names(cls: type) -> tuple[str, ...]:
+    # fields are the same for every instance of a class - walk dir() once
+    return tuple(a for a in dir(cls)
+                 if isinstance(getattr(cls, a), property) and a != "immutable")
+
+
 class PropertyDict:
 
-    __slots__ = ("_immutable")
+    __slots__ = ("_immutable", "_hash")
 
     def __init__(self, immutable: bool = False):
         if not isinstance(immutable, bool):
@@ -20,6 +29,7 @@ class PropertyDict:
                        f"(received object of type: {type(immutable)})")
             raise TypeError(err_msg)
         self._immutable = immutable
+        self._hash = None
 
     @property
     def immutable(self) -> bool:
@@ -29,15 +39,25 @@ class PropertyDict:
         return zip(self.keys(), self.values())
 
     def keys(self) -> Iterator[str]:
-        is_property = lambda a: isinstance(getattr(type(self), a), property)
-        return (a for a in dir(type(self))
-                if is_property(a) and a != "immutable")
+        return iter(_property_names(type(self)))
 
     def values(self) -> Iterator[Any]:
         return (getattr(self, attr) for attr in self.keys())
 
     def __contains__(self, key: str) -> bool:
-        return key in self.keys()
+        return key in _property_names(type(self))
+
+    def __copy__(self) -> PropertyDict:
+        # fields were validated when `self` was built - skip the setters
+        result = object.__new__(type(self))
+        for cls in type(self).__mro__:
+            slots = getattr(cls, "__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for slot in slots:
+                if hasattr(self, slot):
+                    object.__setattr__(result, slot, getattr(self, slot))
+        return result
 
     def __eq__(self, other: dict | PropertyDict) -> bool:
         if not issubclass(type(other), (dict, PropertyDict)):
@@ -58,7 +78,7 @@ class PropertyDict:
             err_msg = (f"[{error_trace()}] key must be a string (received "
                        f"object of type: {type(key)})")
             raise TypeError(err_msg)
-        if key not in self.keys():
+        if key not in _property_names(type(self)):
             raise KeyError(key)
         return getattr(self, key)
 
@@ -67,14 +87,16 @@ class PropertyDict:
             err_msg = (f"[{error_trace()}] PropertyDict cannot be hashed: "
                        f"instance must be immutable")
             raise TypeError(err_msg)  # hash(mutable) always throws TypeError
-        return hash(tuple(self.items()))
+        if self._hash is None:  # fields can't change, so compute only once
+            self._hash = hash(tuple(self.items()))
+        return self._hash
 
     def __iter__(self) -> Iterable[str]:
         yield from self.keys()
 
     def __len__(self) -> int:
         # this will always evaluate to the number of @property attributes
-        return len(list(self.keys()))
+        return len(_property_names(type(self)))
 
     def __repr__(self) -> str:
         return f"PropertyDict(immutable={self.immutable})"
@@ -84,7 +106,7 @@ class PropertyDict:
             err_msg = (f"[{error_trace()}] key must be a string (received "
                        f"object of type: {type(key)})")
             raise TypeError(err_msg)
-        if key not in self.keys():
+        if key not in _property_names(type(self)):
             raise KeyError(key)
         setattr(self, key, val)
 
@@ -140,8 +162,7 @@ class ChannelInfo(PropertyDict):
             err_msg = (f"[{error_trace()}] `json_path` does not point to a "
                        f".json file: {json_path}")
             raise ValueError(err_msg)
-        with json_path.open("r") as json_file:
-            saved = json.load(json_file)
+        saved = json.loads(json_path.read_bytes())
         return cls(channel_id=saved["channel_id"],
                    channel_name=saved["channel_name"],
                    last_updated=datetime.fromisoformat(saved["last_updated"]),
@@ -264,9 +285,12 @@ class ChannelInfo(PropertyDict):
                 err_msg = (f"[{error_trace()}] `save_to` must end with a "
                            f".json file extension (received: {save_to})")
                 raise ValueError(err_msg)
-            save_to.parent.mkdir(parents=True, exist_ok=True)
-            with save_to.open("w") as json_file:
-                json.dump(json_dict, json_file)
+            text = json.dumps(json_dict)
+            try:
+                save_to.write_text(text)
+            except FileNotFoundError:  # parent directory is missing
+                save_to.parent.mkdir(parents=True, exist_ok=True)
+                save_to.write_text(text)
         return json_dict
 
     def __repr__(self) -> str:
@@ -394,6 +418,12 @@ class VideoInfo(PropertyDict):
                  "_publish_date", "_last_updated", "_duration", "_description",
                  "_keywords", "_thumbnail_url")
 
+    # the id formats the setters accept, spelled out for the tests to check
+    # fixtures against.  The setters themselves use len()/startswith(),
+    # which is faster than a fullmatch
+    _CHANNEL_ID_RE = re.compile(r"UC.{22}", re.DOTALL)
+    _VIDEO_ID_RE = re.compile(r".{11}", re.DOTALL)
+
     def __init__(self,
                  channel_id: str,
                  channel_name: str,
@@ -432,8 +462,7 @@ class VideoInfo(PropertyDict):
             err_msg = (f"[{error_trace()}] `json_path` does not point to a "
                        f".json file: {json_path}")
             raise ValueError(err_msg)
-        with json_path.open("r") as json_file:
-            saved = json.load(json_file)
+        saved = json.loads(json_path.read_bytes())
         return cls(channel_id=saved["channel_id"],
                    channel_name=saved["channel_name"],
                    video_id=saved["video_id"],
@@ -524,7 +553,7 @@ class VideoInfo(PropertyDict):
         self._duration = new_duration
 
     @property
-    def keywords(self) -> list[str] | tuple[str]:
+    def keywords(self) -> tuple[str, ...]:
         return self._keywords
 
     @keywords.setter
@@ -545,10 +574,8 @@ class VideoInfo(PropertyDict):
             if not keyword:
                 context = f"(received empty keyword at index: {index})"
                 raise ValueError(f"{err_msg} {context}")
-        if self.immutable:
-            self._keywords = tuple(new_keywords)
-        else:
-            self._keywords = list(new_keywords)
+        # stored as a tuple so the value can be shared without defensive copies
+        self._keywords = tuple(new_keywords)
 
     @property
     def last_updated(self) -> datetime:
@@ -686,9 +713,12 @@ class VideoInfo(PropertyDict):
                 err_msg = (f"[{error_trace()}] `save_to` must end with a "
                            f".json file extension (received: {save_to})")
                 raise ValueError(err_msg)
-            save_to.parent.mkdir(parents=True, exist_ok=True)
-            with save_to.open("w") as json_file:
-                json.dump(json_dict, json_file)
+            text = json.dumps(json_dict)
+            try:
+                save_to.write_text(text)
+            except FileNotFoundError:  # parent directory is missing
+                save_to.parent.mkdir(parents=True, exist_ok=True)
+                save_to.write_text(text)
         return json_dict
 
     def __repr__(self) -> str:
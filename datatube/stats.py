@@ -1,13 +1,14 @@
 from __future__ import annotations
 from datetime import datetime, timedelta, timezone
+import io
 from pathlib import Path
+import stat
 import warnings
 
 import numpy as np
 import pandas as pd
 import pandas.api.types as pdtypes
 
-from datatube import is_video_id
 from datatube.check import is_video_id
 from datatube.error import error_trace
 
@@ -15,18 +16,53 @@ from datatube.error import error_trace
 AVAILABLE_DTYPES = (object, int, float, complex, str, bool, datetime, timedelta)
 
 
+DTYPE_CHECKS = {  # order indicates priority in kwargless lookup
+    object: pdtypes.is_object_dtype,  # convert_dtypes -> not a str
+    int: pdtypes.is_integer_dtype,
+    float: pdtypes.is_float_dtype,
+    complex: pdtypes.is_complex_dtype,
+    # "numeric": pdtypes.is_numeric_dtype,
+    str: pdtypes.is_string_dtype,
+    bool: pdtypes.is_bool_dtype,
+    datetime: pdtypes.is_datetime64_any_dtype,
+    timedelta: pdtypes.is_timedelta64_dtype
+}
+
+
+def _convert_column(column: pd.Series) -> pd.Series:
+    try:
+        return column.convert_dtypes()
+    except TypeError:
+        return column
+
+
+class _ColumnFacts(dict):
+    # dtype predicate results for one column, each evaluated on first lookup
+
+    __slots__ = ("column",)
+
+    def __init__(self, column: pd.Series):
+        super().__init__()
+        self.column = column
+
+    def __missing__(self, typespec: type) -> bool:
+        if typespec is str and self[object]:
+            result = False  # column is better described as object
+        else:
+            result = DTYPE_CHECKS[typespec](self.column)
+        self[typespec] = result
+        return result
+
+
+def _check_facts(facts: _ColumnFacts, typespec: type | tuple[type]) -> bool:
+    # multiple typespecs
+    if isinstance(typespec, (tuple, list, set)):
+        return any(facts[ts] for ts in typespec)
+    # single typespec
+    return facts[typespec]
+
+
 def check_dtypes(data: pd.DataFrame, **kwargs) -> bool:
-    dtype_lookup = {  # order indicates priority in kwargless lookup
-        object: pdtypes.is_object_dtype,  # convert_dtypes -> not a str
-        int: pdtypes.is_integer_dtype,
-        float: pdtypes.is_float_dtype,
-        complex: pdtypes.is_complex_dtype,
-        # "numeric": pdtypes.is_numeric_dtype,
-        str: pdtypes.is_string_dtype,
-        bool: pdtypes.is_bool_dtype,
-        datetime: pdtypes.is_datetime64_any_dtype,
-        timedelta: pdtypes.is_timedelta64_dtype
-    }
     # convert_dtypes always emits a ComplexWarning on complex-valued columns
     warnings.simplefilter("ignore", np.ComplexWarning)
 
@@ -34,39 +70,33 @@ def check_dtypes(data: pd.DataFrame, **kwargs) -> bool:
     if len(kwargs) == 0:
         result = {}
         for col_name in data.columns:
-            try:
-                column = data[col_name].convert_dtypes()
-            except TypeError:
-                column = data[col_name]
-            for typespec, typecheck in dtype_lookup.items():
-                if typecheck(column):
+            facts = _ColumnFacts(_convert_column(data[col_name]))
+            for typespec in DTYPE_CHECKS:  # stop at the first match
+                if facts[typespec]:
                     result[col_name] = typespec
                     break
         return result
 
-    def check_column(col_name, typespec):
-        try:
-            column = data[col_name].convert_dtypes()
-        except TypeError:
-            column = data[col_name]
-        # single typespec
-        if not isinstance(typespec, (tuple, list, set)):
-            if typespec == str and dtype_lookup[object](column):
-                return False  # column is better described as object
-            return dtype_lookup[typespec](column)
-        # multiple typespecs
-        results = []
-        for ts in typespec:
-            if ts == str and dtype_lookup[object](column):
-                results.append(False)
-            else:
-                results.append(dtype_lookup[ts](column))
-        return any(results)
-
-    return all(check_column(col_name, typespec)
+    return all(_check_facts(_ColumnFacts(_convert_column(data[col_name])),
+                            typespec)
                for col_name, typespec in kwargs.items())
 
 
+def check_dtypes_matrix(
+    data: pd.DataFrame,
+    candidates: dict[str, list[type]]
+) -> dict[str, dict[type, bool]]:
+    # convert_dtypes always emits a ComplexWarning on complex-valued columns
+    warnings.simplefilter("ignore", np.ComplexWarning)
+
+    # infer each column once, then answer every candidate from cached facts
+    result = {}
+    for col_name, typespecs in candidates.items():
+        facts = _ColumnFacts(_convert_column(data[col_name]))
+        result[col_name] = {ts: _check_facts(facts, ts) for ts in typespecs}
+    return result
+
+
 def coerce_dtypes(data: pd.DataFrame, **kwargs) -> pd.DataFrame:
     dtype_lookup = {
         object: np.dtype("O"),
@@ -91,7 +121,7 @@ def coerce_dtypes(data: pd.DataFrame, **kwargs) -> pd.DataFrame:
                    f"to an atomic data type: {tuple(atomics)}")
         raise RuntimeError(err_msg)
 
-    # kwargs
+    # kwargs - columns that already match are copied as-is, not converted
     result = data.copy()
     for col_name, typespec in kwargs.items():
         if check_dtypes(data, **{col_name: typespec}):
@@ -246,18 +276,23 @@ class Stats:
         #     self._data = coerce_dtypes(data, **expected_types)
 
     @classmethod
-    def from_csv(cls, csv_path: Path) -> Stats:
+    def from_csv(cls, csv_path: Path | io.IOBase) -> Stats:
         err_msg = (f"[{error_trace(cls)}] `csv_path` must be a Path-like "
-                   f"object pointing to a .csv file on local storage")
-        if not isinstance(csv_path, Path):
+                   f"object pointing to a .csv file on local storage or an "
+                   f"open file-like buffer")
+        if not isinstance(csv_path, (Path, io.IOBase)):
             context = f"(received object of type: {type(csv_path)})"
             raise TypeError(f"{err_msg} {context}")
-        if not csv_path.exists():
-            context = f"(path does not exist: {csv_path})"
-            raise ValueError(f"{err_msg} {context}")
-        if not csv_path.is_file() or csv_path.suffix != ".csv":
-            context = f"(path does not point to a .csv file: {csv_path})"
-            raise ValueError(f"{err_msg} {context}")
+        if isinstance(csv_path, Path):  # buffers are read as-is
+            # one stat() instead of exists() followed by is_file()
+            try:
+                mode = csv_path.stat().st_mode
+            except (FileNotFoundError, NotADirectoryError):
+                context = f"(path does not exist: {csv_path})"
+                raise ValueError(f"{err_msg} {context}") from None
+            if not stat.S_ISREG(mode) or csv_path.suffix != ".csv":
+                context = f"(path does not point to a .csv file: {csv_path})"
+                raise ValueError(f"{err_msg} {context}")
         dtypes = {"video_id": str,
                   "views": np.int64,
                   "rating": np.float64,
@@ -366,14 +401,15 @@ class Stats:
             self._data[k] = self._data[k].astype(v)  # restore old dtype
         self._data = self._data.sort_values(["video_id", "timestamp"])
 
-    def to_csv(self, csv_path: Path, *video_ids: str) -> None:
+    def to_csv(self, csv_path: Path | io.IOBase, *video_ids: str) -> None:
         # csv_path errors
         err_msg = (f"[{error_trace()}] `csv_path` must be a Path-like "
-                   f"object with a .csv file extension")
-        if not isinstance(csv_path, Path):
+                   f"object with a .csv file extension or an open file-like "
+                   f"buffer")
+        if not isinstance(csv_path, (Path, io.IOBase)):
             context = f"(received object of type: {type(csv_path)})"
             raise TypeError(f"{err_msg} {context}")
-        if not csv_path.suffix == ".csv":
+        if isinstance(csv_path, Path) and csv_path.suffix != ".csv":
             context = f"(path does not end with .csv extension: {csv_path})"
             raise ValueError(f"{err_msg} {context}")
 
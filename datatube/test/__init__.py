@@ -1,7 +1,6 @@
+from pathlib import Path
+
 from datatube import ROOT_DIR
-from .channel_test import *
-from .video_test import *
-from .stats_test import *
 
 
 TEST_DIR = Path(ROOT_DIR, "datatube", "test")
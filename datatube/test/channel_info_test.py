@@ -1,7 +1,11 @@
-from datetime import datetime, timezone
+from collections import ChainMap
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import json
 from pathlib import Path
+import re
 import reprlib
+from typing import Any, Mapping
 import unittest
 
 if __name__ == "__main__":
@@ -47,260 +51,165 @@ EXPECTED_JSON = {
 DB_NAME = "datatube_test"
 
 
-unittest.TestCase.maxDiff = None
-
-
-class HtmlDictGetterSetterTests(unittest.TestCase):
-
-    def test_init_good_input(self):
-        html = ChannelInfo.HtmlDict(**HTML_PROPERTIES)
-        self.assertEqual(html.about, HTML_PROPERTIES["about"])
-        self.assertEqual(html.community, HTML_PROPERTIES["community"])
-        self.assertEqual(html.featured_channels,
-                         HTML_PROPERTIES["featured_channels"])
-        self.assertEqual(html.videos, HTML_PROPERTIES["videos"])
-
-    def test_init_immutable_bad_type(self):
-        test_val = 123
-        self.assertNotIsInstance(test_val, bool)
-        err_msg = (f"[datatube.info.HtmlDict.__init__] `immutable` must be a "
-                   f"boolean (received object of type: {type(test_val)})")
-
-        with self.assertRaises(TypeError) as err:
-            ChannelInfo.HtmlDict(**HTML_PROPERTIES, immutable=test_val)
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_about_html(self):
-        test_val = "some other html code"
-        self.assertNotEqual(test_val, HTML_PROPERTIES["about"])
-
-        # from init
-        html = ChannelInfo.HtmlDict(**{**HTML_PROPERTIES, "about": test_val})
-        self.assertEqual(html.about, test_val)
+def props(**overrides) -> ChainMap:
+    # layered view over TEST_PROPERTIES - overrides are never copied into a
+    # new 7-entry dict, and the base is never touched
+    return ChainMap(overrides, TEST_PROPERTIES)
 
-        # from property getter/setter
-        html = ChannelInfo.HtmlDict(**HTML_PROPERTIES)
-        html.about = test_val
-        self.assertEqual(html.about, test_val)
 
-        # from getitem/setitem
-        html = ChannelInfo.HtmlDict(**HTML_PROPERTIES)
-        html["about"] = test_val
-        self.assertEqual(html["about"], test_val)
+def html_props(**overrides) -> ChainMap:
+    # same as props(), but layered over HTML_PROPERTIES
+    return ChainMap(overrides, HTML_PROPERTIES)
 
-    def test_set_about_html_immutable_instance(self):
-        test_val = "some other html code"
-        self.assertNotEqual(test_val, HTML_PROPERTIES["about"])
-        err_msg = ("[datatube.info.HtmlDict.about] cannot reassign `about`: "
-                   "HtmlDict instance is immutable")
 
-        # from property getter/setter
-        html = ChannelInfo.HtmlDict(**HTML_PROPERTIES, immutable=True)
-        with self.assertRaises(AttributeError) as err:
-            html.about = test_val
-        self.assertEqual(str(err.exception), err_msg)
+@lru_cache
+def error_pattern(message: str, exact: bool = True) -> re.Pattern:
+    # each expected message is compiled once, however many cases share it
+    pattern = "^" + re.escape(message)
+    return re.compile(pattern + "$" if exact else pattern)
 
-        # from getitem/setitem
-        with self.assertRaises(AttributeError) as err:
-            html["about"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_about_html_bad_type(self):
-        test_val = 123
-        self.assertNotIsInstance(test_val, str)
-        err_msg = (f"[datatube.info.HtmlDict.about] `about` must be a string "
-                   f"(received object of type: {type(test_val)})")
-
-        # from init
-        with self.assertRaises(TypeError) as err:
-            ChannelInfo.HtmlDict(**{**HTML_PROPERTIES, "about": test_val})
-        self.assertEqual(str(err.exception), err_msg)
 
-        # from property getter/setter
-        html = ChannelInfo.HtmlDict(**HTML_PROPERTIES)
-        with self.assertRaises(TypeError) as err:
-            html.about = test_val
-        self.assertEqual(str(err.exception), err_msg)
+ACCESS_MODES = ("init", "attribute", "item")
 
-        # from getitem/setitem
-        with self.assertRaises(TypeError) as err:
-            html["about"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
 
-    def test_set_community_html(self):
-        test_val = "some other html code"
-        self.assertNotEqual(test_val, HTML_PROPERTIES["community"])
+def assign(cls: type,
+           base: Mapping[str, Any],
+           mode: str,
+           field: str,
+           value: Any,
+           instance: Any = None) -> Any:
+    # set `field` through one of the three public paths into `cls`
+    if mode == "init":
+        return cls(**ChainMap({field: value}, base))
+    if instance is None:
+        instance = cls(**base)
+    if mode == "attribute":
+        setattr(instance, field, value)
+    else:
+        instance[field] = value
+    return instance
 
-        # from init
-        html = ChannelInfo.HtmlDict(**{**HTML_PROPERTIES,
-                                       "community": test_val})
-        self.assertEqual(html.community, test_val)
 
-        # from property getter/setter
-        html = ChannelInfo.HtmlDict(**HTML_PROPERTIES)
-        html.community = test_val
-        self.assertEqual(html.community, test_val)
+HTML_GOOD_VALUE = "some other html code"
+HTML_IMMUTABLE_ERRORS = {
+    field: (f"[datatube.info.HtmlDict.{field}] cannot reassign `{field}`: "
+            f"HtmlDict instance is immutable")
+    for field in HTML_PROPERTIES
+}
+HTML_BAD_TYPE_ERRORS = {
+    field: (f"[datatube.info.HtmlDict.{field}] `{field}` must be a string "
+            f"(received object of type: {int})")
+    for field in HTML_PROPERTIES
+}
 
-        # from getitem/setitem
-        html = ChannelInfo.HtmlDict(**HTML_PROPERTIES)
-        html["community"] = test_val
-        self.assertEqual(html["community"], test_val)
+SETTER_ERRORS = {
+    "channel_id": ("`channel_id` must be a 24-character ExternalId string "
+                   "starting with 'UC'"),
+    "channel_name": "`channel_name` must be a non-empty string",
+    "last_updated": ("`last_updated` must be a timezone-aware "
+                     "datetime.datetime object stating the last time this "
+                     "channel's information was checked for updates")
+}
 
-    def test_set_community_html_immutable_instance(self):
-        test_val = "some other html code"
-        self.assertNotEqual(test_val, HTML_PROPERTIES["community"])
-        err_msg = ("[datatube.info.HtmlDict.community] cannot reassign "
-                   "`community`: HtmlDict instance is immutable")
 
-        # from property getter/setter
-        html = ChannelInfo.HtmlDict(**HTML_PROPERTIES, immutable=True)
-        with self.assertRaises(AttributeError) as err:
-            html.community = test_val
-        self.assertEqual(str(err.exception), err_msg)
+def setter_error(field: str, context: str) -> str:
+    return (f"[datatube.info.ChannelInfo.{field}] {SETTER_ERRORS[field]} "
+            f"({context})")
 
-        # from getitem/setitem
-        with self.assertRaises(AttributeError) as err:
-            html["community"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
 
-    def test_set_community_html_bad_type(self):
-        test_val = 123
-        self.assertNotIsInstance(test_val, str)
-        err_msg = (f"[datatube.info.HtmlDict.community] `community` must be a "
-                   f"string (received object of type: {type(test_val)})")
+IMMUTABLE_ERRORS = {
+    field: (f"[datatube.info.ChannelInfo.{field}] cannot reassign "
+            f"`{field}`: ChannelInfo instance is immutable")
+    for field in SETTER_ERRORS
+}
 
-        # from init
-        with self.assertRaises(TypeError) as err:
-            ChannelInfo.HtmlDict(**{**HTML_PROPERTIES, "community": test_val})
-        self.assertEqual(str(err.exception), err_msg)
+# (field, good value) - every good value differs from TEST_PROPERTIES
+GOOD_VALUES = {
+    "channel_id": "UC_some_other_channel_id",  # still 24 characters
+    "channel_name": "Some Other Channel Name",
+    "last_updated": TEST_PROPERTIES["last_updated"] - timedelta(seconds=1)
+}
 
-        # from property getter/setter
-        html = ChannelInfo.HtmlDict(**HTML_PROPERTIES)
-        with self.assertRaises(TypeError) as err:
-            html.community = test_val
-        self.assertEqual(str(err.exception), err_msg)
+# (field, bad value, exception type, error message)
+NAIVE_DATETIME = datetime(2020, 1, 1)
+BAD_VALUES = [
+    ("channel_id", 123, TypeError,
+     setter_error("channel_id", f"received object of type: {int}")),
+    ("channel_id", "UC_not_24_chars", ValueError,
+     setter_error("channel_id", "received: 'UC_not_24_chars'")),
+    ("channel_id", "_does_not_start_with_UC_", ValueError,
+     setter_error("channel_id", "received: '_does_not_start_with_UC_'")),
+    ("channel_name", 123, TypeError,
+     setter_error("channel_name", f"received object of type: {int}")),
+    ("channel_name", "", ValueError,
+     setter_error("channel_name", "received: ''")),
+    ("last_updated", 123, TypeError,
+     setter_error("last_updated", f"received object of type: {int}")),
+    ("last_updated", NAIVE_DATETIME, ValueError,
+     setter_error("last_updated",
+                  f"timestamp has no timezone information: "
+                  f"{repr(NAIVE_DATETIME)}"))
+]
+FUTURE_TIMESTAMP = datetime(9999, 12, 31, tzinfo=timezone.utc)
+FUTURE_ERROR_PREFIX = (f"[datatube.info.ChannelInfo.last_updated] "
+                       f"{SETTER_ERRORS['last_updated']} (timestamp in the "
+                       f"future: {FUTURE_TIMESTAMP} > ")
 
-        # from getitem/setitem
-        with self.assertRaises(TypeError) as err:
-            html["community"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
 
-    def test_set_featured_channels_html(self):
-        test_val = "some other html code"
-        self.assertNotEqual(test_val, HTML_PROPERTIES["featured_channels"])
+unittest.TestCase.maxDiff = None
 
-        # from init
-        html = ChannelInfo.HtmlDict(**{**HTML_PROPERTIES,
-                                       "featured_channels": test_val})
-        self.assertEqual(html.featured_channels, test_val)
 
-        # from property getter/setter
-        html = ChannelInfo.HtmlDict(**HTML_PROPERTIES)
-        html.featured_channels = test_val
-        self.assertEqual(html.featured_channels, test_val)
+class HtmlDictGetterSetterTests(unittest.TestCase):
 
-        # from getitem/setitem
+    def test_init_good_input(self):
         html = ChannelInfo.HtmlDict(**HTML_PROPERTIES)
-        html["featured_channels"] = test_val
-        self.assertEqual(html["featured_channels"], test_val)
-
-    def test_set_featured_channels_html_immutable_instance(self):
-        test_val = "some other html code"
-        self.assertNotEqual(test_val, HTML_PROPERTIES["featured_channels"])
-        err_msg = ("[datatube.info.HtmlDict.featured_channels] cannot reassign "
-                   "`featured_channels`: HtmlDict instance is immutable")
-
-        # from property getter/setter
-        html = ChannelInfo.HtmlDict(**HTML_PROPERTIES, immutable=True)
-        with self.assertRaises(AttributeError) as err:
-            html.featured_channels = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(AttributeError) as err:
-            html["featured_channels"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
+        self.assertEqual(html, HTML_PROPERTIES)
 
-    def test_set_featured_channels_html_bad_type(self):
+    def test_init_immutable_bad_type(self):
         test_val = 123
-        self.assertNotIsInstance(test_val, str)
-        err_msg = (f"[datatube.info.HtmlDict.featured_channels] "
-                   f"`featured_channels` must be a string (received object "
-                   f"of type: {type(test_val)})")
-
-        # from init
-        with self.assertRaises(TypeError) as err:
-            ChannelInfo.HtmlDict(**{**HTML_PROPERTIES,
-                                    "featured_channels": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        html = ChannelInfo.HtmlDict(**HTML_PROPERTIES)
-        with self.assertRaises(TypeError) as err:
-            html.featured_channels = test_val
-        self.assertEqual(str(err.exception), err_msg)
+        self.assertNotIsInstance(test_val, bool)
+        err_msg = (f"[datatube.info.HtmlDict.__init__] `immutable` must be a "
+                   f"boolean (received object of type: {type(test_val)})")
 
-        # from getitem/setitem
         with self.assertRaises(TypeError) as err:
-            html["featured_channels"] = test_val
+            ChannelInfo.HtmlDict(**HTML_PROPERTIES, immutable=test_val)
         self.assertEqual(str(err.exception), err_msg)
 
-    def test_set_videos_html(self):
-        test_val = "some other html code"
-        self.assertNotEqual(test_val, HTML_PROPERTIES["videos"])
+    def test_fixture_distinctness(self):
+        # HTML_GOOD_VALUE must actually change each field
+        for field in HTML_PROPERTIES:
+            with self.subTest(field=field):
+                self.assertNotEqual(HTML_GOOD_VALUE, HTML_PROPERTIES[field])
 
-        # from init
-        html = ChannelInfo.HtmlDict(**{**HTML_PROPERTIES, "videos": test_val})
-        self.assertEqual(html.videos, test_val)
+    def test_set_good_values(self):
+        for field in HTML_PROPERTIES:
+            for mode in ACCESS_MODES:
+                with self.subTest(field=field, mode=mode):
+                    html = assign(ChannelInfo.HtmlDict, HTML_PROPERTIES, mode,
+                                  field, HTML_GOOD_VALUE)
+                    self.assertEqual(getattr(html, field), HTML_GOOD_VALUE)
+                    self.assertEqual(html[field], HTML_GOOD_VALUE)
 
-        # from property getter/setter
-        html = ChannelInfo.HtmlDict(**HTML_PROPERTIES)
-        html.videos = test_val
-        self.assertEqual(html.videos, test_val)
-
-        # from getitem/setitem
-        html = ChannelInfo.HtmlDict(**HTML_PROPERTIES)
-        html["videos"] = test_val
-        self.assertEqual(html["videos"], test_val)
-
-    def test_set_videos_html_immutable_instance(self):
-        test_val = "some other html code"
-        self.assertNotEqual(test_val, HTML_PROPERTIES["videos"])
-        err_msg = ("[datatube.info.HtmlDict.videos] cannot reassign "
-                   "`videos`: HtmlDict instance is immutable")
-
-        # from property getter/setter
+    def test_set_immutable_instance(self):
         html = ChannelInfo.HtmlDict(**HTML_PROPERTIES, immutable=True)
-        with self.assertRaises(AttributeError) as err:
-            html.videos = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(AttributeError) as err:
-            html["videos"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_videos_html_bad_type(self):
+        for field, err_msg in HTML_IMMUTABLE_ERRORS.items():
+            pattern = error_pattern(err_msg)
+            for mode in ACCESS_MODES[1:]:  # init builds a new instance
+                with self.subTest(field=field, mode=mode):
+                    with self.assertRaisesRegex(AttributeError, pattern):
+                        assign(ChannelInfo.HtmlDict, HTML_PROPERTIES, mode,
+                               field, HTML_GOOD_VALUE, html)
+
+    def test_set_bad_type(self):
         test_val = 123
         self.assertNotIsInstance(test_val, str)
-        err_msg = (f"[datatube.info.HtmlDict.videos] `videos` must be a "
-                   f"string (received object of type: {type(test_val)})")
-
-        # from init
-        with self.assertRaises(TypeError) as err:
-            ChannelInfo.HtmlDict(**{**HTML_PROPERTIES, "videos": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter + property getter/setter
-        html = ChannelInfo.HtmlDict(**HTML_PROPERTIES)
-        with self.assertRaises(TypeError) as err:
-            html.videos = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter + getitem/setitem
-        with self.assertRaises(TypeError) as err:
-            html["videos"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
+        for field, err_msg in HTML_BAD_TYPE_ERRORS.items():
+            pattern = error_pattern(err_msg)
+            for mode in ACCESS_MODES:
+                with self.subTest(field=field, mode=mode):
+                    with self.assertRaisesRegex(TypeError, pattern):
+                        assign(ChannelInfo.HtmlDict, HTML_PROPERTIES, mode,
+                               field, test_val)
 
     def test_getitem_key_error(self):
         test_key = "this key does not exist"
@@ -367,7 +276,7 @@ class HtmlDictDunderTests(unittest.TestCase):
         test_val = "different from html1"
         for key, val in HTML_PROPERTIES.items():
             self.assertNotEqual(val, test_val)
-            html3 = ChannelInfo.HtmlDict(**{**HTML_PROPERTIES, key: test_val})
+            html3 = ChannelInfo.HtmlDict(**html_props(**{key: test_val}))
             self.assertNotEqual(html1, html3)
 
     def test_equality_base_dicts(self):
@@ -398,7 +307,7 @@ class HtmlDictDunderTests(unittest.TestCase):
         # unequal values
         test_val = "different from html1"
         for key in HTML_PROPERTIES:
-            html3 = ChannelInfo.HtmlDict(**{**HTML_PROPERTIES, key: test_val},
+            html3 = ChannelInfo.HtmlDict(**html_props(**{key: test_val}),
                                          immutable=True)
             self.assertNotEqual(hash(html1), hash(html3))
 
@@ -458,15 +367,7 @@ class ChannelInfoGetterSetterTests(unittest.TestCase):
 
     def test_init_good_input(self):
         info = ChannelInfo(**TEST_PROPERTIES)
-        self.assertEqual(info.channel_id, TEST_PROPERTIES["channel_id"])
-        self.assertEqual(info.channel_name, TEST_PROPERTIES["channel_name"])
-        self.assertEqual(info.last_updated, TEST_PROPERTIES["last_updated"])
-        self.assertEqual(info.html["about"], TEST_PROPERTIES["about_html"])
-        self.assertEqual(info.html["community"],
-                         TEST_PROPERTIES["community_html"])
-        self.assertEqual(info.html["featured_channels"],
-                         TEST_PROPERTIES["featured_channels_html"])
-        self.assertEqual(info.html["videos"], TEST_PROPERTIES["videos_html"])
+        self.assertEqual(info, EXPECTED_CHANNELINFO)
 
     def test_init_immutable_bad_type(self):
         test_val = 123
@@ -478,303 +379,49 @@ class ChannelInfoGetterSetterTests(unittest.TestCase):
             ChannelInfo(**TEST_PROPERTIES, immutable=test_val)
         self.assertEqual(str(err.exception), err_msg)
 
-    def test_set_channel_id(self):
-        test_val = "UC_some_other_channel_id"  # still 24 characters
-        self.assertEqual(len(test_val), 24)
-        self.assertTrue(test_val.startswith("UC"))
-        self.assertNotEqual(test_val, TEST_PROPERTIES["channel_id"])
-
-        # from init
-        info = ChannelInfo(**{**TEST_PROPERTIES, "channel_id": test_val})
-        self.assertEqual(info.channel_id, test_val)
-
-        # from property getter/setter
-        info = ChannelInfo(**TEST_PROPERTIES)
-        info.channel_id = test_val
-        self.assertEqual(info.channel_id, test_val)
-
-        # from getitem/setitem
-        info = ChannelInfo(**TEST_PROPERTIES)
-        info["channel_id"] = test_val
-        self.assertEqual(info["channel_id"], test_val)
-
-    def test_set_channel_id_immutable_instance(self):
-        test_val = "UC_some_other_channel_id"  # still 24 characters
-        self.assertEqual(len(test_val), 24)
-        self.assertTrue(test_val.startswith("UC"))
-        self.assertNotEqual(test_val, TEST_PROPERTIES["channel_id"])
-        err_msg = ("[datatube.info.ChannelInfo.channel_id] cannot reassign "
-                   "`channel_id`: ChannelInfo instance is immutable")
-
-        # from property getter/setter
-        info = ChannelInfo(**TEST_PROPERTIES, immutable=True)
-        with self.assertRaises(AttributeError) as err:
-            info.channel_id = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(AttributeError) as err:
-            info["channel_id"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_channel_id_bad_type(self):
-        test_val = 123
-        self.assertNotIsInstance(test_val, str)
-        err_msg = (f"[datatube.info.ChannelInfo.channel_id] `channel_id` must "
-                   f"be a 24-character ExternalId string starting with 'UC' "
-                   f"(received object of type: {type(test_val)})")
-
-        # from init
-        with self.assertRaises(TypeError) as err:
-            ChannelInfo(**{**TEST_PROPERTIES, "channel_id": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = ChannelInfo(**TEST_PROPERTIES)
-        with self.assertRaises(TypeError) as err:
-            info.channel_id = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(TypeError) as err:
-            info["channel_id"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_channel_id_bad_length(self):
-        test_val = "UC_not_24_chars"
-        self.assertNotEqual(len(test_val), 24)
-        self.assertTrue(test_val.startswith("UC"))
-        err_msg = (f"[datatube.info.ChannelInfo.channel_id] `channel_id` must "
-                   f"be a 24-character ExternalId string starting with 'UC' "
-                   f"(received: {repr(test_val)})")
-
-        # from init
-        with self.assertRaises(ValueError) as err:
-            ChannelInfo(**{**TEST_PROPERTIES, "channel_id": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = ChannelInfo(**TEST_PROPERTIES)
-        with self.assertRaises(ValueError) as err:
-            info.channel_id = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(ValueError) as err:
-            info["channel_id"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_channel_id_doesnt_start_with_UC(self):
-        test_val = "_does_not_start_with_UC_"  # still 24 characters
-        self.assertEqual(len(test_val), 24)
-        self.assertFalse(test_val.startswith("UC"))
-        err_msg = (f"[datatube.info.ChannelInfo.channel_id] `channel_id` must "
-                   f"be a 24-character ExternalId string starting with 'UC' "
-                   f"(received: {repr(test_val)})")
-
-        # from init
-        with self.assertRaises(ValueError) as err:
-            ChannelInfo(**{**TEST_PROPERTIES, "channel_id": test_val})
-        self.assertEqual(str(err.exception), err_msg)
+    def test_fixture_distinctness(self):
+        # every GOOD_VALUES entry must actually change its field
+        for field, test_val in GOOD_VALUES.items():
+            with self.subTest(field=field):
+                self.assertNotEqual(test_val, TEST_PROPERTIES[field])
 
-        # from property getter/setter
-        info =  ChannelInfo(**TEST_PROPERTIES)
-        with self.assertRaises(ValueError) as err:
-            info.channel_id = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(ValueError) as err:
-            info["channel_id"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_channel_name(self):
-        test_val = "Some Other Channel Name"
-        self.assertNotEqual(test_val, TEST_PROPERTIES["channel_name"])
-
-        # from init
-        info = ChannelInfo(**{**TEST_PROPERTIES, "channel_name": test_val})
-        self.assertEqual(info.channel_name, test_val)
+    def test_set_good_values(self):
+        for field, test_val in GOOD_VALUES.items():
+            for mode in ACCESS_MODES:
+                with self.subTest(field=field, mode=mode):
+                    info = assign(ChannelInfo, TEST_PROPERTIES, mode, field,
+                                  test_val)
+                    self.assertEqual(getattr(info, field), test_val)
+                    self.assertEqual(info[field], test_val)
 
-        # from property getter/setter
-        info = ChannelInfo(**TEST_PROPERTIES)
-        info.channel_name = test_val
-        self.assertEqual(info.channel_name, test_val)
-
-        # from getitem/setitem
-        info = ChannelInfo(**TEST_PROPERTIES)
-        info["channel_name"] = test_val
-        self.assertEqual(info["channel_name"], test_val)
-
-    def test_set_channel_name_immutable_instance(self):
-        test_val = "Some Other Channel Name"
-        self.assertNotEqual(test_val, TEST_PROPERTIES["channel_name"])
-        err_msg = ("[datatube.info.ChannelInfo.channel_name] cannot reassign "
-                   "`channel_name`: ChannelInfo instance is immutable")
-
-        # from property getter/setter
+    def test_set_immutable_instance(self):
         info = ChannelInfo(**TEST_PROPERTIES, immutable=True)
-        with self.assertRaises(AttributeError) as err:
-            info.channel_name = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(AttributeError) as err:
-            info["channel_name"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_channel_name_bad_type(self):
-        test_val = 123
-        self.assertNotIsInstance(test_val, str)
-        err_msg = (f"[datatube.info.ChannelInfo.channel_name] `channel_name` "
-                   f"must be a non-empty string (received object of type: "
-                   f"{type(test_val)})")
-
-        # from init
-        with self.assertRaises(TypeError) as err:
-            ChannelInfo(**{**TEST_PROPERTIES, "channel_name": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = ChannelInfo(**TEST_PROPERTIES)
-        with self.assertRaises(TypeError) as err:
-            info.channel_name = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(TypeError) as err:
-            info["channel_name"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_channel_name_empty_string(self):
-        test_val = ""
-        self.assertEqual(test_val, "")
-        err_msg = (f"[datatube.info.ChannelInfo.channel_name] `channel_name` "
-                   f"must be a non-empty string (received: {repr(test_val)})")
-
-        # from init
-        with self.assertRaises(ValueError) as err:
-            ChannelInfo(**{**TEST_PROPERTIES, "channel_name": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = ChannelInfo(**TEST_PROPERTIES)
-        with self.assertRaises(ValueError) as err:
-            info.channel_name = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(ValueError) as err:
-            info["channel_name"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_last_updated(self):
-        test_val = datetime.now(timezone.utc)
-        self.assertNotEqual(test_val, TEST_PROPERTIES["last_updated"])
-
-        # from init
-        info = ChannelInfo(**{**TEST_PROPERTIES, "last_updated": test_val})
-        self.assertEqual(info.last_updated, test_val)
-
-        # from property getter/setter
-        info = ChannelInfo(**TEST_PROPERTIES)
-        info.last_updated = test_val
-        self.assertEqual(info.last_updated, test_val)
-
-        # from getitem/setitem
-        info = ChannelInfo(**TEST_PROPERTIES)
-        info["last_updated"] = test_val
-        self.assertEqual(info["last_updated"], test_val)
-
-    def test_set_last_updated_immutable_instance(self):
-        test_val = datetime.now(timezone.utc)
-        self.assertNotEqual(test_val, TEST_PROPERTIES["last_updated"])
-        err_msg = ("[datatube.info.ChannelInfo.last_updated] cannot reassign "
-                   "`last_updated`: ChannelInfo instance is immutable")
-
-        # from property getter/setter
-        info = ChannelInfo(**TEST_PROPERTIES, immutable=True)
-        with self.assertRaises(AttributeError) as err:
-            info.last_updated = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(AttributeError) as err:
-            info["last_updated"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_last_updated_bad_type(self):
-        test_val = 123
-        self.assertNotIsInstance(test_val, datetime)
-        err_msg = (f"[datatube.info.ChannelInfo.last_updated] `last_updated` "
-                   f"must be a timezone-aware datetime.datetime object stating "
-                   f"the last time this channel's information was checked for "
-                   f"updates (received object of type: {type(test_val)})")
-
-        # from init
-        with self.assertRaises(TypeError) as err:
-            ChannelInfo(**{**TEST_PROPERTIES, "last_updated": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = ChannelInfo(**TEST_PROPERTIES)
-        with self.assertRaises(TypeError) as err:
-            info.last_updated = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(TypeError) as err:
-            info["last_updated"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_last_updated_has_no_timezone(self):
-        test_val = datetime.now()  # no tzinfo
-        self.assertIsNone(test_val.tzinfo)
-        err_msg = (f"[datatube.info.ChannelInfo.last_updated] `last_updated` "
-                   f"must be a timezone-aware datetime.datetime object stating "
-                   f"the last time this channel's information was checked for "
-                   f"updates (timestamp has no timezone information: "
-                   f"{repr(test_val)})")
-
-        # from init
-        with self.assertRaises(ValueError) as err:
-            ChannelInfo(**{**TEST_PROPERTIES, "last_updated": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = ChannelInfo(**TEST_PROPERTIES)
-        with self.assertRaises(ValueError) as err:
-            info.last_updated = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(ValueError) as err:
-            info["last_updated"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
+        for field, test_val in GOOD_VALUES.items():
+            pattern = error_pattern(IMMUTABLE_ERRORS[field])
+            for mode in ACCESS_MODES[1:]:  # init builds a new instance
+                with self.subTest(field=field, mode=mode):
+                    with self.assertRaisesRegex(AttributeError, pattern):
+                        assign(ChannelInfo, TEST_PROPERTIES, mode, field,
+                               test_val, info)
+
+    def test_set_bad_values(self):
+        for field, test_val, exc, err_msg in BAD_VALUES:
+            pattern = error_pattern(err_msg)
+            for mode in ACCESS_MODES:
+                with self.subTest(field=field, value=test_val, mode=mode):
+                    with self.assertRaisesRegex(exc, pattern):
+                        assign(ChannelInfo, TEST_PROPERTIES, mode, field,
+                               test_val)
 
     def test_set_last_updated_in_future(self):
-        test_val = datetime(9999, 12, 31, tzinfo=timezone.utc)
+        test_val = FUTURE_TIMESTAMP
         self.assertGreater(test_val, datetime.now(timezone.utc))
-        err_msg = (f"[datatube.info.ChannelInfo.last_updated] `last_updated` "
-                   f"must be a timezone-aware datetime.datetime object stating "
-                   f"the last time this channel's information was checked for "
-                   f"updates (timestamp in the future: {test_val} > ")
-
-        # from init
-        with self.assertRaises(ValueError) as err:
-            ChannelInfo(**{**TEST_PROPERTIES, "last_updated": test_val})
-        self.assertEqual(str(err.exception)[:len(err_msg)], err_msg)
-
-        # from property getter/setter
-        info = ChannelInfo(**TEST_PROPERTIES)
-        with self.assertRaises(ValueError) as err:
-            info.last_updated = test_val
-        self.assertEqual(str(err.exception)[:len(err_msg)], err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(ValueError) as err:
-            info["last_updated"] = test_val
-        self.assertEqual(str(err.exception)[:len(err_msg)], err_msg)
+        pattern = error_pattern(FUTURE_ERROR_PREFIX, exact=False)
+        for mode in ACCESS_MODES:
+            with self.subTest(mode=mode):
+                with self.assertRaisesRegex(ValueError, pattern):
+                    assign(ChannelInfo, TEST_PROPERTIES, mode,
+                           "last_updated", test_val)
 
     def test_set_html(self):
         test_val = {"about": "different html",
@@ -785,7 +432,7 @@ class ChannelInfoGetterSetterTests(unittest.TestCase):
 
         # from init
         init_dict = {f"{k}_html": v for k, v in test_val.items()}
-        info = ChannelInfo(**{**TEST_PROPERTIES, **init_dict})
+        info = ChannelInfo(**props(**init_dict))
         self.assertEqual(info.html, ChannelInfo.HtmlDict(**test_val))
         self.assertEqual(info.html, test_val)
 
@@ -981,7 +628,7 @@ class ChannelInfoDunderTests(unittest.TestCase):
         }
         for key, test_val in different.items():
             self.assertNotEqual(test_val, TEST_PROPERTIES[key])
-            info3 = ChannelInfo(**{**TEST_PROPERTIES, key: test_val})
+            info3 = ChannelInfo(**props(**{key: test_val}))
             self.assertNotEqual(info1, info3)
 
     def test_equality_base_dict(self):
@@ -1042,7 +689,7 @@ class ChannelInfoDunderTests(unittest.TestCase):
         }
         for key, test_val in different.items():
             self.assertNotEqual(test_val, TEST_PROPERTIES[key])
-            info3 = ChannelInfo(**{**TEST_PROPERTIES, key: test_val},
+            info3 = ChannelInfo(**props(**{key: test_val}),
                                 immutable=True)
             self.assertNotEqual(hash(info1), hash(info3))
 
@@ -1119,15 +766,7 @@ class ChannelInfoJSONTests(unittest.TestCase):
 
     def test_from_json(self):
         info = ChannelInfo.from_json(JSON_PATH)
-        self.assertEqual(info.channel_id, TEST_PROPERTIES["channel_id"])
-        self.assertEqual(info.channel_name, TEST_PROPERTIES["channel_name"])
-        self.assertEqual(info.last_updated, TEST_PROPERTIES["last_updated"])
-        self.assertEqual(info.html["about"], TEST_PROPERTIES["about_html"])
-        self.assertEqual(info.html["community"],
-                         TEST_PROPERTIES["community_html"])
-        self.assertEqual(info.html["featured_channels"],
-                         TEST_PROPERTIES["featured_channels_html"])
-        self.assertEqual(info.html["videos"], TEST_PROPERTIES["videos_html"])
+        self.assertEqual(info, EXPECTED_CHANNELINFO)
 
         # immutable
         info = ChannelInfo.from_json(JSON_PATH, immutable=True)
@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 import json
 from pathlib import Path
+import tempfile
 import time
 import unittest
 
@@ -278,6 +279,36 @@ class BasicChannelTests(unittest.TestCase):
             test_json = json.load(json_file)
         self.assertEqual(test_json, expected)
 
+    def test_from_local(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        channel_path = Path(temp_dir.name, TEST_PROPERTIES["channel_id"])
+        channel_path.mkdir()
+        saved = {
+            "id": TEST_PROPERTIES["channel_id"],
+            "name": TEST_PROPERTIES["channel_name"],
+            "fetched_at": TEST_PROPERTIES["last_updated"].isoformat(),
+            "about_html": TEST_PROPERTIES["about_html"],
+            "community_html": TEST_PROPERTIES["community_html"],
+            "featured_channels_html": TEST_PROPERTIES["featured_channels_html"],
+            "videos_html": TEST_PROPERTIES["videos_html"]
+        }
+        Path(channel_path, "info.json").write_text(json.dumps(saved))
+        for video_id in TEST_PROPERTIES["video_ids"]:
+            Path(channel_path, video_id).mkdir()
+            Path(channel_path, video_id, "info.json").touch()
+        # neither of these are readable videos
+        Path(channel_path, "DifferentId").mkdir()
+        Path(channel_path, "notes.txt").touch()
+
+        c = Channel.from_local(channel_path)
+        self.assertEqual(c.source, "local")
+        self.assertEqual(c.id, TEST_PROPERTIES["channel_id"])
+        self.assertEqual(c.last_updated, TEST_PROPERTIES["last_updated"])
+        self.assertEqual(c.target_dir, channel_path)
+        self.assertEqual(sorted(c.video_ids),
+                         sorted(TEST_PROPERTIES["video_ids"]))
+
     def test_contains(self):
         c = Channel(**TEST_PROPERTIES)
 
@@ -333,12 +364,14 @@ class BasicChannelTests(unittest.TestCase):
         c1 = Channel(**TEST_PROPERTIES)
         c2 = Channel(**TEST_PROPERTIES)
         self.assertEqual(c1, c2)
+        self.assertEqual(hash(c1), hash(c2))
         # Rick Astley
         c3 = Channel(**{**TEST_PROPERTIES,
                         "channel_id": "UCuAXFkgsw1L7xaCfnd5JJOw"})
         self.assertNotEqual(c1, c3)
         c4 = Channel(**{**TEST_PROPERTIES, "last_updated": datetime.now()})
         self.assertNotEqual(c1, c4)
+        self.assertNotEqual(c1, TEST_PROPERTIES["channel_id"])
 
     def test_length(self):
         c = Channel(**TEST_PROPERTIES)
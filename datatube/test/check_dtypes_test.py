@@ -1,6 +1,5 @@
 from datetime import datetime, timedelta, timezone
 import random
-from tabnanny import check
 import unittest
 
 import pandas as pd
@@ -143,9 +142,7 @@ class CheckDtypeTests(unittest.TestCase):
             series = pd.Series(data)
             result = check_dtypes(series, int)
             expected = col_name in TEST_DATA[int]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = f"check_dtypes({data[:3]}..., int) != {expected}"
                 failed.append(context)
         if len(failed) > 0:
@@ -158,9 +155,7 @@ class CheckDtypeTests(unittest.TestCase):
             series = pd.Series(data + [None])
             result = check_dtypes(series, int)
             expected = col_name in TEST_DATA[int]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = f"check_dtypes({data[:3]}..., int) != {expected}"
                 failed.append(context)
         if len(failed) > 0:
@@ -173,9 +168,7 @@ class CheckDtypeTests(unittest.TestCase):
         for col_name in df.columns:
             result = check_dtypes(df, {col_name: int})
             expected = col_name in TEST_DATA[int]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = (f"check_dtypes(df, {{{repr(col_name)}: int}}) != "
                            f"{expected}")
                 failed.append(context)
@@ -190,9 +183,7 @@ class CheckDtypeTests(unittest.TestCase):
         for col_name in df.columns:
             result = check_dtypes(df, {col_name: int})
             expected = col_name in TEST_DATA[int]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = (f"check_dtypes(df, {{{repr(col_name)}: int}}) != "
                            f"{expected}")
                 failed.append(context)
@@ -206,9 +197,7 @@ class CheckDtypeTests(unittest.TestCase):
             series = pd.Series(data)
             result = check_dtypes(series, float)
             expected = col_name in TEST_DATA[float]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = f"check_dtypes({data[:3]}..., float) != {expected}"
                 failed.append(context)
         if len(failed) > 0:
@@ -221,9 +210,7 @@ class CheckDtypeTests(unittest.TestCase):
             series = pd.Series(data + [None])
             result = check_dtypes(series, float)
             expected = col_name in TEST_DATA[float]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = f"check_dtypes({data[:3]}..., float) != {expected}"
                 failed.append(context)
         if len(failed) > 0:
@@ -236,9 +223,7 @@ class CheckDtypeTests(unittest.TestCase):
         for col_name in df.columns:
             result = check_dtypes(df, {col_name: float})
             expected = col_name in TEST_DATA[float]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = (f"check_dtypes(df, {{{repr(col_name)}: float}}) != "
                            f"{expected}")
                 failed.append(context)
@@ -253,9 +238,7 @@ class CheckDtypeTests(unittest.TestCase):
         for col_name in df.columns:
             result = check_dtypes(df, {col_name: float})
             expected = col_name in TEST_DATA[float]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = (f"check_dtypes(df, {{{repr(col_name)}: float}}) != "
                            f"{expected}")
                 failed.append(context)
@@ -269,9 +252,7 @@ class CheckDtypeTests(unittest.TestCase):
             series = pd.Series(data)
             result = check_dtypes(series, complex)
             expected = col_name in TEST_DATA[complex]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = f"check_dtypes({data[:3]}..., complex) != {expected}"
                 failed.append(context)
         if len(failed) > 0:
@@ -284,9 +265,7 @@ class CheckDtypeTests(unittest.TestCase):
             series = pd.Series(data + [None])
             result = check_dtypes(series, complex)
             expected = col_name in TEST_DATA[complex]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = f"check_dtypes({data[:3]}..., complex) != {expected}"
                 failed.append(context)
         if len(failed) > 0:
@@ -299,9 +278,7 @@ class CheckDtypeTests(unittest.TestCase):
         for col_name in df.columns:
             result = check_dtypes(df, {col_name: complex})
             expected = col_name in TEST_DATA[complex]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = (f"check_dtypes(df, {{{repr(col_name)}: complex}}) "
                            f"!= {expected}")
                 failed.append(context)
@@ -316,9 +293,7 @@ class CheckDtypeTests(unittest.TestCase):
         for col_name in df.columns:
             result = check_dtypes(df, {col_name: complex})
             expected = col_name in TEST_DATA[complex]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = (f"check_dtypes(df, {{{repr(col_name)}: complex}}) "
                            f"!= {expected}")
                 failed.append(context)
@@ -332,9 +307,7 @@ class CheckDtypeTests(unittest.TestCase):
             series = pd.Series(data)
             result = check_dtypes(series, str)
             expected = col_name in TEST_DATA[str]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = f"check_dtypes({data[:3]}..., str) != {expected}"
                 failed.append(context)
         if len(failed) > 0:
@@ -347,9 +320,7 @@ class CheckDtypeTests(unittest.TestCase):
             series = pd.Series(data + [None])
             result = check_dtypes(series, str)
             expected = col_name in TEST_DATA[str]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = f"check_dtypes({data[:3]}..., str) != {expected}"
                 failed.append(context)
         if len(failed) > 0:
@@ -362,9 +333,7 @@ class CheckDtypeTests(unittest.TestCase):
         for col_name in df.columns:
             result = check_dtypes(df, {col_name: str})
             expected = col_name in TEST_DATA[str]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = (f"check_dtypes(df, {{{repr(col_name)}: str}}) != "
                            f"{expected}")
                 failed.append(context)
@@ -379,9 +348,7 @@ class CheckDtypeTests(unittest.TestCase):
         for col_name in df.columns:
             result = check_dtypes(df, {col_name: str})
             expected = col_name in TEST_DATA[str]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = (f"check_dtypes(df, {{{repr(col_name)}: str}}) != "
                            f"{expected}")
                 failed.append(context)
@@ -395,9 +362,7 @@ class CheckDtypeTests(unittest.TestCase):
             series = pd.Series(data)
             result = check_dtypes(series, bool)
             expected = col_name in TEST_DATA[bool]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = f"check_dtypes({data[:3]}..., bool) != {expected}"
                 failed.append(context)
         if len(failed) > 0:
@@ -410,9 +375,7 @@ class CheckDtypeTests(unittest.TestCase):
             series = pd.Series(data + [None])
             result = check_dtypes(series, bool)
             expected = col_name in TEST_DATA[bool]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = f"check_dtypes({data[:3]}..., bool) != {expected}"
                 failed.append(context)
         if len(failed) > 0:
@@ -425,9 +388,7 @@ class CheckDtypeTests(unittest.TestCase):
         for col_name in df.columns:
             result = check_dtypes(df, {col_name: bool})
             expected = col_name in TEST_DATA[bool]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = (f"check_dtypes(df, {{{repr(col_name)}: bool}}) != "
                            f"{expected}")
                 failed.append(context)
@@ -442,9 +403,7 @@ class CheckDtypeTests(unittest.TestCase):
         for col_name in df.columns:
             result = check_dtypes(df, {col_name: bool})
             expected = col_name in TEST_DATA[bool]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = (f"check_dtypes(df, {{{repr(col_name)}: bool}}) != "
                            f"{expected}")
                 failed.append(context)
@@ -458,9 +417,7 @@ class CheckDtypeTests(unittest.TestCase):
             series = pd.Series(data)
             result = check_dtypes(series, datetime)
             expected = col_name in TEST_DATA[datetime]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = f"check_dtypes({data[:3]}..., datetime) != {expected}"
                 failed.append(context)
         if len(failed) > 0:
@@ -473,9 +430,7 @@ class CheckDtypeTests(unittest.TestCase):
             series = pd.Series(data + [None])
             result = check_dtypes(series, datetime)
             expected = col_name in TEST_DATA[datetime]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = f"check_dtypes({data[:3]}..., datetime) != {expected}"
                 failed.append(context)
         if len(failed) > 0:
@@ -488,9 +443,7 @@ class CheckDtypeTests(unittest.TestCase):
         for col_name in df.columns:
             result = check_dtypes(df, {col_name: datetime})
             expected = col_name in TEST_DATA[datetime]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = (f"check_dtypes(df, {{{repr(col_name)}: datetime}}) "
                            f"!= {expected}")
                 failed.append(context)
@@ -505,9 +458,7 @@ class CheckDtypeTests(unittest.TestCase):
         for col_name in df.columns:
             result = check_dtypes(df, {col_name: datetime})
             expected = col_name in TEST_DATA[datetime]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = (f"check_dtypes(df, {{{repr(col_name)}: datetime}}) "
                            f"!= {expected}")
                 failed.append(context)
@@ -521,9 +472,7 @@ class CheckDtypeTests(unittest.TestCase):
             series = pd.Series(data)
             result = check_dtypes(series, timedelta)
             expected = col_name in TEST_DATA[timedelta]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = f"check_dtypes({data[:3]}..., timedelta) != {expected}"
                 failed.append(context)
         if len(failed) > 0:
@@ -536,9 +485,7 @@ class CheckDtypeTests(unittest.TestCase):
             series = pd.Series(data + [None])
             result = check_dtypes(series, timedelta)
             expected = col_name in TEST_DATA[timedelta]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = f"check_dtypes({data[:3]}..., timedelta) != {expected}"
                 failed.append(context)
         if len(failed) > 0:
@@ -551,9 +498,7 @@ class CheckDtypeTests(unittest.TestCase):
         for col_name in df.columns:
             result = check_dtypes(df, {col_name: timedelta})
             expected = col_name in TEST_DATA[timedelta]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = (f"check_dtypes(df, {{{repr(col_name)}: timedelta}}) "
                            f"!= {expected}")
                 failed.append(context)
@@ -568,9 +513,7 @@ class CheckDtypeTests(unittest.TestCase):
         for col_name in df.columns:
             result = check_dtypes(df, {col_name: timedelta})
             expected = col_name in TEST_DATA[timedelta]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = (f"check_dtypes(df, {{{repr(col_name)}: timedelta}}) "
                            f"!= {expected}")
                 failed.append(context)
@@ -584,9 +527,7 @@ class CheckDtypeTests(unittest.TestCase):
             series = pd.Series(data)
             result = check_dtypes(series, object)
             expected = col_name in TEST_DATA[object]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = f"check_dtypes({data[:3]}..., object) != {expected}"
                 failed.append(context)
         if len(failed) > 0:
@@ -599,9 +540,7 @@ class CheckDtypeTests(unittest.TestCase):
             series = pd.Series(data + [None])
             result = check_dtypes(series, object)
             expected = col_name in TEST_DATA[object]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = f"check_dtypes({data[:3]}..., object) != {expected}"
                 failed.append(context)
         if len(failed) > 0:
@@ -614,9 +553,7 @@ class CheckDtypeTests(unittest.TestCase):
         for col_name in df.columns:
             result = check_dtypes(df, {col_name: object})
             expected = col_name in TEST_DATA[object]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = (f"check_dtypes(df, {{{repr(col_name)}: object}}) != "
                            f"{expected}")
                 failed.append(context)
@@ -631,9 +568,7 @@ class CheckDtypeTests(unittest.TestCase):
         for col_name in df.columns:
             result = check_dtypes(df, {col_name: object})
             expected = col_name in TEST_DATA[object]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = (f"check_dtypes(df, {{{repr(col_name)}: object}}) != "
                            f"{expected}")
                 failed.append(context)
@@ -653,9 +588,7 @@ class CheckDtypeArgumentTests(unittest.TestCase):
                       if col_name in subset]
             self.assertEqual(len(lookup), 1)
             expected = lookup[0]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = f"check_dtypes({list(series.head(2))}) != {expected}"
                 failed.append(context)
         if len(failed) > 0:
@@ -671,9 +604,7 @@ class CheckDtypeArgumentTests(unittest.TestCase):
                       if col_name in subset]
             self.assertEqual(len(lookup), 1)
             expected = lookup[0]
-            try:
-                self.assertEqual(result, expected)
-            except AssertionError:
+            if result != expected:
                 context = f"check_dtypes({list(series.head(2))}) != {expected}"
                 failed.append(context)
         if len(failed) > 0:
@@ -709,9 +640,7 @@ class CheckDtypeArgumentTests(unittest.TestCase):
         types_str = tuple([t.__name__ for t in all_types])
         for data in ALL_DATA.values():
             series = pd.Series(data)
-            try:
-                self.assertTrue(check_dtypes(series, all_types))
-            except AssertionError:
+            if not check_dtypes(series, all_types):
                 context = (f"check_dtypes({list(series.head(2))}, "
                            f"{types_str}) != True")
                 failed.append(context)
@@ -726,9 +655,7 @@ class CheckDtypeArgumentTests(unittest.TestCase):
         types_str = tuple([t.__name__ for t in all_types])
         for data in with_na.values():
             series = pd.Series(data)
-            try:
-                self.assertTrue(check_dtypes(series, all_types))
-            except AssertionError:
+            if not check_dtypes(series, all_types):
                 context = (f"check_dtypes({list(series.head(2))}, "
                            f"{types_str}) != True")
                 failed.append(context)
@@ -742,9 +669,7 @@ class CheckDtypeArgumentTests(unittest.TestCase):
         all_types = tuple(TEST_DATA)
         types_str = tuple([t.__name__ for t in all_types])
         for col_name in df.columns:
-            try:
-                self.assertTrue(check_dtypes(df, {col_name: all_types}))
-            except AssertionError:
+            if not check_dtypes(df, {col_name: all_types}):
                 context = (f"check_dtypes(df, {{{repr(col_name)}: "
                            f"{types_str}}}) != True")
                 failed.append(context)
@@ -759,9 +684,7 @@ class CheckDtypeArgumentTests(unittest.TestCase):
         all_types = tuple(TEST_DATA)
         types_str = tuple([t.__name__ for t in all_types])
         for col_name in df.columns:
-            try:
-                self.assertTrue(check_dtypes(df, {col_name: all_types}))
-            except AssertionError:
+            if not check_dtypes(df, {col_name: all_types}):
                 context = (f"check_dtypes(df, {{{repr(col_name)}: "
                            f"{types_str}}}) != True")
                 failed.append(context)
@@ -1,7 +1,14 @@
+from collections import ChainMap
+import copy
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import json
 from pathlib import Path
+import re
 import reprlib
+import tempfile
+from types import MappingProxyType
+from typing import Any
 import unittest
 
 if __name__ == "__main__":
@@ -11,1029 +18,327 @@ from datatube.info import VideoInfo
 from datatube.test import DATA_DIR
 
 
-TEST_PROPERTIES = {
+# a single frozen clock reading keeps timestamp comparisons deterministic
+NOW = datetime.now(timezone.utc)
+EARLIER = NOW - timedelta(seconds=1)
+# smallest step past NOW - the tightest publish_date that must be rejected
+LATER = NOW + timedelta(microseconds=1)
+TEST_PROPERTIES = MappingProxyType({
     "channel_id": "UC_24_character_channel_",
     "channel_name": "Some Channel",
     "video_id": "11character",
     "video_title": "Some Video",
     "publish_date": datetime(2020, 1, 1, tzinfo=timezone.utc),
-    "last_updated": datetime.now(timezone.utc),
+    "last_updated": NOW,
     "duration": timedelta(minutes=5),
     "description": "Video description...",
     "keywords": ("datatube", "test", "foo", "bar", "baz"),
     "thumbnail_url": "https://i.kym-cdn.com/photos/images/original/000/581/296/c09.jpg"
-}
+})
 EXPECTED_VIDEOINFO = {k: v for k, v in sorted(TEST_PROPERTIES.items())}
-JSON_PATH = Path(DATA_DIR, "test_video_info.json")
-EXPECTED_JSON = {
-    "channel_id": TEST_PROPERTIES["channel_id"],
-    "channel_name": TEST_PROPERTIES["channel_name"],
-    "video_id": TEST_PROPERTIES["video_id"],
-    "video_title": TEST_PROPERTIES["video_title"],
-    "publish_date": TEST_PROPERTIES["publish_date"].isoformat(),
-    "last_updated": TEST_PROPERTIES["last_updated"].isoformat(),
-    "duration": TEST_PROPERTIES["duration"].total_seconds(),
-    "description": TEST_PROPERTIES["description"],
-    "keywords": list(TEST_PROPERTIES["keywords"]),
-    "thumbnail_url": TEST_PROPERTIES["thumbnail_url"]
+EXPECTED_ITEMS = tuple(EXPECTED_VIDEOINFO.items())
+EXPECTED_KEYS = tuple(EXPECTED_VIDEOINFO)
+EXPECTED_VALUES = tuple(EXPECTED_VIDEOINFO.values())
+
+
+def props(**overrides) -> ChainMap:
+    # layered view over TEST_PROPERTIES - overrides are never copied into a
+    # new 10-entry dict, and the read-only base is never touched
+    return ChainMap(overrides, TEST_PROPERTIES)
+
+
+# validated once at import - read-only tests share it directly, while tests
+# that mutate take cheap copies of it
+BASE_INFO = VideoInfo(**TEST_PROPERTIES)
+# immutable, so a single instance can be shared by every test that needs one
+IMMUTABLE_INFO = VideoInfo(**TEST_PROPERTIES, immutable=True)
+
+SETTER_ERRORS = {
+    "channel_id": ("`channel_id` must be a 24-character ExternalId string "
+                   "starting with 'UC'"),
+    "channel_name": "`channel_name` must be a non-empty string",
+    "video_id": "`video_id` must be an 11-character video ID string",
+    "video_title": "`video_title` must be a non-empty string",
+    "publish_date": ("`publish_date` must be a timezone-aware "
+                     "datetime.datetime object stating when this video was "
+                     "uploaded to youtube"),
+    "last_updated": ("`last_updated` must be a timezone-aware "
+                     "datetime.datetime object stating the last time this "
+                     "video's data was requested from YouTube"),
+    "duration": ("`duration` must be a datetime.timedelta object describing "
+                 "the video's total runtime"),
+    "description": "`description` must be a string",
+    "keywords": ("`keywords` must be a list, tuple, or set of keyword "
+                 "strings associated with this video"),
+    "thumbnail_url": "`thumbnail_url` must be a valid url string"
 }
-DB_NAME = "datatube_test"
-
-
-unittest.TestCase.maxDiff = None
 
 
-class VideoInfoGetterSetterTests(unittest.TestCase):
-
-    def test_init_good_input(self):
-        info = VideoInfo(**TEST_PROPERTIES)
-        self.assertEqual(info.channel_id, TEST_PROPERTIES["channel_id"])
-        self.assertEqual(info.channel_name, TEST_PROPERTIES["channel_name"])
-        self.assertEqual(info.video_id, TEST_PROPERTIES["video_id"])
-        self.assertEqual(info.video_title, TEST_PROPERTIES["video_title"])
-        self.assertEqual(info.publish_date, TEST_PROPERTIES["publish_date"])
-        self.assertEqual(info.last_updated, TEST_PROPERTIES["last_updated"])
-        self.assertEqual(info.duration, TEST_PROPERTIES["duration"])
-        self.assertEqual(info.description, TEST_PROPERTIES["description"])
-        self.assertEqual(info.keywords, TEST_PROPERTIES["keywords"])
-        self.assertEqual(info.thumbnail_url, TEST_PROPERTIES["thumbnail_url"])
-
-    def test_immutable_bad_type(self):
-        test_val = 123
-        self.assertNotIsInstance(test_val, bool)
-        err_msg = (f"[datatube.info.VideoInfo.__init__] `immutable` must be "
-                   f"a boolean (received object of type: {type(test_val)})")
+def setter_error(field: str, context: str) -> str:
+    return (f"[datatube.info.VideoInfo.{field}] {SETTER_ERRORS[field]} "
+            f"({context})")
 
-        with self.assertRaises(TypeError) as err:
-            VideoInfo(**TEST_PROPERTIES, immutable=test_val)
-        self.assertEqual(str(err.exception), err_msg)
 
-    def test_set_channel_id(self):
-        test_val = "UC_some_other_channel_id"  # still 24 characters
-        self.assertEqual(len(test_val), 24)
-        self.assertTrue(test_val.startswith("UC"))
-        self.assertNotEqual(test_val, TEST_PROPERTIES["channel_id"])
+@lru_cache
+def error_pattern(message: str, exact: bool = True) -> re.Pattern:
+    # each expected message is compiled once, however many cases share it
+    pattern = "^" + re.escape(message)
+    return re.compile(pattern + "$" if exact else pattern)
 
-        # from init
-        info = VideoInfo(**{**TEST_PROPERTIES, "channel_id": test_val})
-        self.assertEqual(info.channel_id, test_val)
 
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        info.channel_id = test_val
-        self.assertEqual(info.channel_id, test_val)
+ACCESS_MODES = ("init", "attribute", "item")
 
-        # from getitem/setitem
-        info = VideoInfo(**TEST_PROPERTIES)
-        info["channel_id"] = test_val
-        self.assertEqual(info["channel_id"], test_val)
-
-    def test_set_channel_id_immutable_instance(self):
-        test_val = "UC_some_other_channel_id"  # still 24 characters
-        self.assertEqual(len(test_val), 24)
-        self.assertTrue(test_val.startswith("UC"))
-        self.assertNotEqual(test_val, TEST_PROPERTIES["channel_id"])
-        err_msg = ("[datatube.info.VideoInfo.channel_id] cannot reassign "
-                   "`channel_id`: VideoInfo instance is immutable")
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES, immutable=True)
-        with self.assertRaises(AttributeError) as err:
-            info.channel_id = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(AttributeError) as err:
-            info["channel_id"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_channel_id_bad_type(self):
-        test_val = 123
-        self.assertNotIsInstance(test_val, str)
-        err_msg = (f"[datatube.info.VideoInfo.channel_id] `channel_id` must "
-                   f"be a 24-character ExternalId string starting with 'UC' "
-                   f"(received object of type: {type(test_val)})")
 
-        # from init
-        with self.assertRaises(TypeError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "channel_id": test_val})
-        self.assertEqual(str(err.exception), err_msg)
+def assign(mode: str,
+           field: str,
+           value: Any,
+           info: VideoInfo | None = None) -> VideoInfo:
+    # set `field` through one of the three public paths into VideoInfo
+    if mode == "init":
+        return VideoInfo(**props(**{field: value}))
+    if info is None:
+        info = copy.copy(BASE_INFO)
+    if mode == "attribute":
+        setattr(info, field, value)
+    else:
+        info[field] = value
+    return info
 
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(TypeError) as err:
-            info.channel_id = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(TypeError) as err:
-            info["channel_id"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_channel_id_bad_length(self):
-        test_val = "UC_not_24_chars"
-        self.assertNotEqual(len(test_val), 24)
-        self.assertTrue(test_val.startswith("UC"))
-        err_msg = (f"[datatube.info.VideoInfo.channel_id] `channel_id` must "
-                   f"be a 24-character ExternalId string starting with 'UC' "
-                   f"(received: {repr(test_val)})")
-
-        # from init
-        with self.assertRaises(ValueError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "channel_id": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(ValueError) as err:
-            info.channel_id = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(ValueError) as err:
-            info["channel_id"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_channel_id_doesnt_start_with_UC(self):
-        test_val = "_does_not_start_with_UC_"  # still 24 characters
-        self.assertEqual(len(test_val), 24)
-        self.assertFalse(test_val.startswith("UC"))
-        err_msg = (f"[datatube.info.VideoInfo.channel_id] `channel_id` must "
-                   f"be a 24-character ExternalId string starting with 'UC' "
-                   f"(received: {repr(test_val)})")
-
-        # from init
-        with self.assertRaises(ValueError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "channel_id": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info =  VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(ValueError) as err:
-            info.channel_id = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(ValueError) as err:
-            info["channel_id"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_channel_name(self):
-        test_val = "Some Other Channel Name"
-        self.assertNotEqual(test_val, TEST_PROPERTIES["channel_name"])
-
-        # from init
-        info = VideoInfo(**{**TEST_PROPERTIES, "channel_name": test_val})
-        self.assertEqual(info.channel_name, test_val)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        info.channel_name = test_val
-        self.assertEqual(info.channel_name, test_val)
 
-        # from getitem/setitem
-        info = VideoInfo(**TEST_PROPERTIES)
-        info["channel_name"] = test_val
-        self.assertEqual(info["channel_name"], test_val)
-
-    def test_set_channel_name_immutable_instance(self):
-        test_val = "Some Other Channel Name"
-        self.assertNotEqual(test_val, TEST_PROPERTIES["channel_name"])
-        err_msg = ("[datatube.info.VideoInfo.channel_name] cannot reassign "
-                   "`channel_name`: VideoInfo instance is immutable")
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES, immutable=True)
-        with self.assertRaises(AttributeError) as err:
-            info.channel_name = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(AttributeError) as err:
-            info["channel_name"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_channel_name_bad_type(self):
-        test_val = 123
-        self.assertNotIsInstance(test_val, str)
-        err_msg = (f"[datatube.info.VideoInfo.channel_name] `channel_name` "
-                   f"must be a non-empty string (received object of type: "
-                   f"{type(test_val)})")
-
-        # from init
-        with self.assertRaises(TypeError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "channel_name": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(TypeError) as err:
-            info.channel_name = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(TypeError) as err:
-            info["channel_name"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_channel_name_empty_string(self):
-        test_val = ""
-        self.assertEqual(test_val, "")
-        err_msg = (f"[datatube.info.VideoInfo.channel_name] `channel_name` "
-                   f"must be a non-empty string (received: {repr(test_val)})")
-
-        # from init
-        with self.assertRaises(ValueError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "channel_name": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(ValueError) as err:
-            info.channel_name = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(ValueError) as err:
-            info["channel_name"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_video_id(self):
-        test_val = "abcdefghijk"  # 11 characters
-        self.assertEqual(len(test_val), 11)
-        self.assertNotEqual(test_val, TEST_PROPERTIES["video_id"])
-
-        # from init
-        info = VideoInfo(**{**TEST_PROPERTIES, "video_id": test_val})
-        self.assertEqual(info.video_id, test_val)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        info.video_id = test_val
-        self.assertEqual(info.video_id, test_val)
-
-        # from getitem/setitem
-        info = VideoInfo(**TEST_PROPERTIES)
-        info["video_id"] = test_val
-        self.assertEqual(info["video_id"], test_val)
-
-    def test_set_video_id_immutable_instance(self):
-        test_val = "abcdefghijk"  # 11 characters
-        self.assertEqual(len(test_val), 11)
-        self.assertNotEqual(test_val, TEST_PROPERTIES["video_id"])
-        err_msg = ("[datatube.info.VideoInfo.video_id] cannot reassign "
-                   "`video_id`: VideoInfo instance is immutable")
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES, immutable=True)
-        with self.assertRaises(AttributeError) as err:
-            info.video_id = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(AttributeError) as err:
-            info["video_id"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_video_id_bad_type(self):
-        test_val = 123
-        self.assertNotIsInstance(test_val, str)
-        err_msg = (f"[datatube.info.VideoInfo.video_id] `video_id` must be an "
-                   f"11-character video ID string (received object of type: "
-                   f"{type(test_val)})")
-
-        # from init
-        with self.assertRaises(TypeError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "video_id": test_val})
-        self.assertEqual(str(err.exception), err_msg)
+IMMUTABLE_ERRORS = {
+    field: (f"[datatube.info.VideoInfo.{field}] cannot reassign `{field}`: "
+            f"VideoInfo instance is immutable")
+    for field in SETTER_ERRORS
+}
+FUTURE_TIMESTAMP = datetime(9999, 12, 31, tzinfo=timezone.utc)
+FUTURE_ERROR_PREFIX = (f"[datatube.info.VideoInfo.last_updated] "
+                       f"{SETTER_ERRORS['last_updated']} (datetime cannot be "
+                       f"in the future: {FUTURE_TIMESTAMP} > ")
+MISSING_KEY = "this key does not exist"
+MISSING_KEY_ERROR = repr(MISSING_KEY)
+
+# strings are shortened the same way VideoInfo.__repr__/__str__ do
+STR_REPR = reprlib.Repr()
+EXPECTED_REPR = "VideoInfo({})".format(", ".join(
+    f"{k}={STR_REPR.repr(v) if isinstance(v, str) else repr(v)}"
+    for k, v in props(immutable=False).items()
+))
+
+# (field, good value) - every good value differs from TEST_PROPERTIES, so
+# these double as the single-field differences for equality/hash tests
+GOOD_VALUES = {
+    "channel_id": "UC_some_other_channel_id",  # still 24 characters
+    "channel_name": "Some Other Channel Name",
+    "video_id": "abcdefghijk",  # 11 characters
+    "video_title": "Some Other Video Title",
+    "publish_date": datetime(1950, 1, 1, tzinfo=timezone.utc),
+    "last_updated": EARLIER,
+    "duration": timedelta(seconds=10),
+    "description": "Some Other Description",
+    "keywords": ("these", "are", "different", "from", "normal"),
+    "thumbnail_url": "https://i.kym-cdn.com/entries/icons/mobile/000/023/397/C-658VsXoAo3ovC.jpg"
+}
 
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(TypeError) as err:
-            info.video_id = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(TypeError) as err:
-            info["video_id"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_video_id_bad_length(self):
-        test_val = "not11characters"
-        self.assertNotEqual(len(test_val), 11)
-        err_msg = (f"[datatube.info.VideoInfo.video_id] `video_id` must be an "
-                   f"11-character video ID string (received: {repr(test_val)})")
-
-        # from init
-        with self.assertRaises(ValueError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "video_id": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(ValueError) as err:
-            info.video_id = test_val
-        self.assertEqual(str(err.exception), err_msg)
+# (field, bad value, exception type, error message)
+NAIVE_DATETIME = datetime(2020, 1, 1)
+BAD_VALUES = [
+    ("channel_id", 123, TypeError,
+     setter_error("channel_id", f"received object of type: {int}")),
+    ("channel_id", "UC_not_24_chars", ValueError,
+     setter_error("channel_id", "received: 'UC_not_24_chars'")),
+    ("channel_id", "_does_not_start_with_UC_", ValueError,
+     setter_error("channel_id", "received: '_does_not_start_with_UC_'")),
+    ("channel_name", 123, TypeError,
+     setter_error("channel_name", f"received object of type: {int}")),
+    ("channel_name", "", ValueError,
+     setter_error("channel_name", "received: ''")),
+    ("video_id", 123, TypeError,
+     setter_error("video_id", f"received object of type: {int}")),
+    ("video_id", "not11characters", ValueError,
+     setter_error("video_id", "received: 'not11characters'")),
+    ("video_title", 123, TypeError,
+     setter_error("video_title", f"received object of type: {int}")),
+    ("video_title", "", ValueError,
+     setter_error("video_title", "received: ''")),
+    ("publish_date", 123, TypeError,
+     setter_error("publish_date", f"received object of type: {int}")),
+    ("publish_date", NAIVE_DATETIME, ValueError,
+     setter_error("publish_date",
+                  f"datetime has no timezone: {repr(NAIVE_DATETIME)}")),
+    ("last_updated", 123, TypeError,
+     setter_error("last_updated", f"received object of type: {int}")),
+    ("last_updated", NAIVE_DATETIME, ValueError,
+     setter_error("last_updated",
+                  f"datetime has no timezone: {repr(NAIVE_DATETIME)}")),
+    ("last_updated", GOOD_VALUES["publish_date"], ValueError,
+     setter_error("last_updated",
+                  f"datetime cannot be less than `publish_date`: "
+                  f"{GOOD_VALUES['publish_date']} < "
+                  f"{TEST_PROPERTIES['publish_date']}")),
+    ("duration", 123, TypeError,
+     setter_error("duration", f"received object of type: {int}")),
+    ("duration", timedelta(seconds=-1), ValueError,
+     setter_error("duration",
+                  f"duration cannot be negative: {timedelta(seconds=-1)} < "
+                  f"{timedelta()}")),
+    ("description", 123, TypeError,
+     setter_error("description", f"received object of type: {int}")),
+    ("keywords", "does not accept naked strings", TypeError,
+     setter_error("keywords", f"received object of type: {str}")),
+    ("keywords", ["fine", "great", 123], TypeError,
+     setter_error("keywords", f"received keyword of type: {int}")),
+    ("keywords", ["fine", "great", ""], ValueError,
+     setter_error("keywords", "received empty keyword at index: 2")),
+    ("thumbnail_url", 123, TypeError,
+     setter_error("thumbnail_url", f"received object of type: {int}")),
+    ("thumbnail_url", "this is not a valid url", ValueError,
+     setter_error("thumbnail_url",
+                  "not a valid url: this is not a valid url"))
+]
 
-        # from getitem/setitem
-        with self.assertRaises(ValueError) as err:
-            info["video_id"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
 
-    def test_set_video_title(self):
-        test_val = "Some Other Video Title"
-        self.assertNotEqual(test_val, TEST_PROPERTIES["video_title"])
+class VideoInfoGetterSetterTests(unittest.TestCase):
 
-        # from init
-        info = VideoInfo(**{**TEST_PROPERTIES, "video_title": test_val})
-        self.assertEqual(info.video_title, test_val)
+    maxDiff = None
 
-        # from property getter/setter
+    def test_init_good_input(self):
         info = VideoInfo(**TEST_PROPERTIES)
-        info.video_title = test_val
-        self.assertEqual(info.video_title, test_val)
+        self.assertEqual(info, EXPECTED_VIDEOINFO)
 
-        # from getitem/setitem
-        info = VideoInfo(**TEST_PROPERTIES)
-        info["video_title"] = test_val
-        self.assertEqual(info["video_title"], test_val)
-
-    def test_set_video_title_immutable_instance(self):
-        test_val = "Some Other Video Title"
-        self.assertNotEqual(test_val, TEST_PROPERTIES["video_title"])
-        err_msg = ("[datatube.info.VideoInfo.video_title] cannot reassign "
-                   "`video_title`: VideoInfo instance is immutable")
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES, immutable=True)
-        with self.assertRaises(AttributeError) as err:
-            info.video_title = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(AttributeError) as err:
-            info["video_title"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_video_title_bad_type(self):
+    def test_immutable_bad_type(self):
         test_val = 123
-        self.assertNotIsInstance(test_val, str)
-        err_msg = (f"[datatube.info.VideoInfo.video_title] `video_title` must "
-                   f"be a non-empty string (received object of type: "
-                   f"{type(test_val)})")
-
-        # from init
-        with self.assertRaises(TypeError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "video_title": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(TypeError) as err:
-            info.video_title = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(TypeError) as err:
-            info["video_title"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_video_title_empty_string(self):
-        test_val = ""
-        self.assertEqual(test_val, "")
-        err_msg = (f"[datatube.info.VideoInfo.video_title] `video_title` must "
-                   f"be a non-empty string (received: {repr(test_val)})")
-
-        # from init
-        with self.assertRaises(ValueError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "video_title": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(ValueError) as err:
-            info.video_title = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(ValueError) as err:
-            info["video_title"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_publish_date(self):
-        test_val = datetime(1950, 1, 1, tzinfo=timezone.utc)
-        self.assertNotEqual(test_val, TEST_PROPERTIES["publish_date"])
-
-        # from init
-        info = VideoInfo(**{**TEST_PROPERTIES, "publish_date": test_val})
-        self.assertEqual(info.publish_date, test_val)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        info.publish_date = test_val
-        self.assertEqual(info.publish_date, test_val)
+        self.assertNotIsInstance(test_val, bool)
+        err_msg = (f"[datatube.info.VideoInfo.__init__] `immutable` must be "
+                   f"a boolean (received object of type: {type(test_val)})")
 
-        # from getitem/setitem
-        info = VideoInfo(**TEST_PROPERTIES)
-        info["publish_date"] = test_val
-        self.assertEqual(info["publish_date"], test_val)
-
-    def test_set_publish_date_immutable_instance(self):
-        test_val = datetime(202, 1, 1, tzinfo=timezone.utc)
-        self.assertNotEqual(test_val, TEST_PROPERTIES["publish_date"])
-        err_msg = ("[datatube.info.VideoInfo.publish_date] cannot reassign "
-                   "`publish_date`: VideoInfo instance is immutable")
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES, immutable=True)
-        with self.assertRaises(AttributeError) as err:
-            info.publish_date = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(AttributeError) as err:
-            info["publish_date"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_publish_date_bad_type(self):
-        test_val = 123
-        self.assertNotIsInstance(test_val, datetime)
-        err_msg = (f"[datatube.info.VideoInfo.publish_date] `publish_date` "
-                   f"must be a timezone-aware datetime.datetime object "
-                   f"stating when this video was uploaded to youtube "
-                   f"(received object of type: {type(test_val)})")
-
-        # from init
-        with self.assertRaises(TypeError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "publish_date": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(TypeError) as err:
-            info.publish_date = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(TypeError) as err:
-            info["publish_date"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_publish_date_has_no_timezone(self):
-        test_val = datetime(2020, 1, 1)
-        self.assertIsNone(test_val.tzinfo)
-        err_msg = (f"[datatube.info.VideoInfo.publish_date] `publish_date` "
-                   f"must be a timezone-aware datetime.datetime object "
-                   f"stating when this video was uploaded to youtube "
-                   f"(datetime has no timezone: {repr(test_val)})")
-
-        # from init
-        with self.assertRaises(ValueError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "publish_date": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(ValueError) as err:
-            info.publish_date = test_val
-        self.assertEqual(str(err.exception), err_msg)
+        with self.assertRaisesRegex(TypeError, error_pattern(err_msg)):
+            VideoInfo(**TEST_PROPERTIES, immutable=test_val)
 
-        # from getitem/setitem
-        with self.assertRaises(ValueError) as err:
-            info["publish_date"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
+    def test_id_patterns(self):
+        patterns = {
+            "channel_id": VideoInfo._CHANNEL_ID_RE,
+            "video_id": VideoInfo._VIDEO_ID_RE
+        }
+        for field, pattern in patterns.items():
+            with self.subTest(field=field):
+                self.assertTrue(pattern.fullmatch(TEST_PROPERTIES[field]))
+                self.assertTrue(pattern.fullmatch(GOOD_VALUES[field]))
+                for bad_field, test_val, exc, _ in BAD_VALUES:
+                    if bad_field == field and exc is ValueError:
+                        self.assertIsNone(pattern.fullmatch(test_val))
+
+    def test_fixture_distinctness(self):
+        # every GOOD_VALUES entry must actually change its field, or the
+        # setter and equality/hash tests below would pass vacuously
+        for field, test_val in GOOD_VALUES.items():
+            with self.subTest(field=field):
+                self.assertNotEqual(test_val, TEST_PROPERTIES[field])
+
+    def test_set_good_values(self):
+        for field, test_val in GOOD_VALUES.items():
+            for mode in ACCESS_MODES:
+                with self.subTest(field=field, mode=mode):
+                    info = assign(mode, field, test_val)
+                    self.assertEqual(getattr(info, field), test_val)
+
+    def test_set_immutable_instance(self):
+        info = IMMUTABLE_INFO
+        for field, test_val in GOOD_VALUES.items():
+            pattern = error_pattern(IMMUTABLE_ERRORS[field])
+            for mode in ACCESS_MODES[1:]:  # init builds a new instance
+                with self.subTest(field=field, mode=mode):
+                    with self.assertRaisesRegex(AttributeError, pattern):
+                        assign(mode, field, test_val, info)
+
+    def test_set_bad_values(self):
+        for field, test_val, exc, err_msg in BAD_VALUES:
+            pattern = error_pattern(err_msg)
+            for mode in ACCESS_MODES:
+                with self.subTest(field=field, value=test_val, mode=mode):
+                    with self.assertRaisesRegex(exc, pattern):
+                        assign(mode, field, test_val)
 
     def test_set_publish_date_greater_than_last_updated(self):
-        test_val = datetime.now(timezone.utc)
+        test_val = LATER
         self.assertGreater(test_val, TEST_PROPERTIES["last_updated"])
-        err_msg = (f"[datatube.info.VideoInfo.publish_date] `publish_date` "
-                   f"must be a timezone-aware datetime.datetime object "
-                   f"stating when this video was uploaded to youtube "
-                   f"(datetime cannot be greater than `last_updated`: "
-                   f"{test_val} > {TEST_PROPERTIES['last_updated']})")
+        err_msg = setter_error("publish_date",
+                               f"datetime cannot be greater than "
+                               f"`last_updated`: {test_val} > "
+                               f"{TEST_PROPERTIES['last_updated']}")
 
         # from init - this gets a different error message than expected because
         # of coupling with `last_updated`, which is defined after `publish_date`
-        with self.assertRaises(ValueError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "publish_date": test_val})
-        coupled_err_msg = (f"[datatube.info.VideoInfo.last_updated] "
-                           f"`last_updated` must be a timezone-aware "
-                           f"datetime.datetime object stating the last time "
-                           f"this video's data was requested from YouTube "
-                           f"(datetime cannot be less than `publish_date`: "
-                           f"{TEST_PROPERTIES['last_updated']} < {test_val})")
-        self.assertEqual(str(err.exception), coupled_err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(ValueError) as err:
-            info.publish_date = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(ValueError) as err:
-            info["publish_date"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_last_updated(self):
-        test_val = datetime.now(timezone.utc)
-        self.assertNotEqual(test_val, TEST_PROPERTIES["last_updated"])
-
-        # from init
-        info = VideoInfo(**{**TEST_PROPERTIES, "last_updated": test_val})
-        self.assertEqual(info.last_updated, test_val)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        info.last_updated = test_val
-        self.assertEqual(info.last_updated, test_val)
-
-        # from getitem/setitem
-        info["last_updated"] = test_val
-        self.assertEqual(info["last_updated"], test_val)
-
-    def test_set_last_updated_immutable_instance(self):
-        test_val = datetime.now(timezone.utc)
-        self.assertNotEqual(test_val, TEST_PROPERTIES["last_updated"])
-        err_msg = (f"[datatube.info.VideoInfo.last_updated] cannot reassign "
-                   f"`last_updated`: VideoInfo instance is immutable")
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES, immutable=True)
-        with self.assertRaises(AttributeError) as err:
-            info.last_updated = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(AttributeError) as err:
-            info["last_updated"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_last_updated_bad_type(self):
-        test_val = 123
-        self.assertNotIsInstance(test_val, datetime)
-        err_msg = (f"[datatube.info.VideoInfo.last_updated] `last_updated` "
-                   f"must be a timezone-aware datetime.datetime object "
-                   f"stating the last time this video's data was requested "
-                   f"from YouTube (received object of type: {type(test_val)})")
-
-        # from init
-        with self.assertRaises(TypeError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "last_updated": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(TypeError) as err:
-            info.last_updated = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(TypeError) as err:
-            info["last_updated"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_last_updated_has_no_timezone(self):
-        test_val = datetime.now()
-        self.assertIsNone(test_val.tzinfo)
-        err_msg = (f"[datatube.info.VideoInfo.last_updated] `last_updated` "
-                   f"must be a timezone-aware datetime.datetime object "
-                   f"stating the last time this video's data was requested "
-                   f"from YouTube (datetime has no timezone: {repr(test_val)})")
-
-        # from init
-        with self.assertRaises(ValueError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "last_updated": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(ValueError) as err:
-            info.last_updated = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(ValueError) as err:
-            info["last_updated"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
+        coupled_err_msg = setter_error("last_updated",
+                                       f"datetime cannot be less than "
+                                       f"`publish_date`: "
+                                       f"{TEST_PROPERTIES['last_updated']} < "
+                                       f"{test_val}")
+        with self.assertRaisesRegex(ValueError,
+                                    error_pattern(coupled_err_msg)):
+            VideoInfo(**props(publish_date=test_val))
+
+        for mode in ACCESS_MODES[1:]:
+            with self.subTest(mode=mode):
+                with self.assertRaisesRegex(ValueError,
+                                            error_pattern(err_msg)):
+                    assign(mode, "publish_date", test_val)
 
     def test_set_last_updated_in_future(self):
-        test_val = datetime(9999, 12, 31, tzinfo=timezone.utc)
-        self.assertGreater(test_val, datetime.now(timezone.utc))
-        err_msg = (f"[datatube.info.VideoInfo.last_updated] `last_updated` "
-                   f"must be a timezone-aware datetime.datetime object "
-                   f"stating the last time this video's data was requested "
-                   f"from YouTube (datetime cannot be in the future: "
-                   f"{test_val} > ")
-
-        # from init
-        with self.assertRaises(ValueError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "last_updated": test_val})
-        self.assertEqual(str(err.exception)[:len(err_msg)], err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(ValueError) as err:
-            info.last_updated = test_val
-        self.assertEqual(str(err.exception)[:len(err_msg)], err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(ValueError) as err:
-            info["last_updated"] = test_val
-        self.assertEqual(str(err.exception)[:len(err_msg)], err_msg)
-
-    def test_set_last_updated_less_than_publish_date(self):
-        test_val = datetime(1950, 1, 1, tzinfo=timezone.utc)
-        self.assertLess(test_val, TEST_PROPERTIES["publish_date"])
-        err_msg = (f"[datatube.info.VideoInfo.last_updated] `last_updated` "
-                   f"must be a timezone-aware datetime.datetime object "
-                   f"stating the last time this video's data was requested "
-                   f"from YouTube (datetime cannot be less than "
-                   f"`publish_date`: {test_val} < "
-                   f"{TEST_PROPERTIES['publish_date']})")
-
-        # from init
-        with self.assertRaises(ValueError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "last_updated": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(ValueError) as err:
-            info.last_updated = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(ValueError) as err:
-            info["last_updated"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_duration(self):
-        test_val = timedelta(seconds=10)
-        self.assertNotEqual(test_val, TEST_PROPERTIES["duration"])
-
-        # from init
-        info = VideoInfo(**{**TEST_PROPERTIES, "duration": test_val})
-        self.assertEqual(info.duration, test_val)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        info.duration = test_val
-        self.assertEqual(info.duration, test_val)
-
-        # from getitem/setitem
-        info = VideoInfo(**TEST_PROPERTIES)
-        info["duration"] = test_val
-        self.assertEqual(info["duration"], test_val)
-
-    def test_set_duration_immutable_instance(self):
-        test_val = timedelta(seconds=10)
-        self.assertNotEqual(test_val, TEST_PROPERTIES["duration"])
-        err_msg = ("[datatube.info.VideoInfo.duration] cannot reassign "
-                   "`duration`: VideoInfo instance is immutable")
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES, immutable=True)
-        with self.assertRaises(AttributeError) as err:
-            info.duration = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(AttributeError) as err:
-            info["duration"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_duration_bad_type(self):
-        test_val = 123
-        self.assertNotIsInstance(test_val, timedelta)
-        err_msg = (f"[datatube.info.VideoInfo.duration] `duration` must be a "
-                   f"datetime.timedelta object describing the video's total "
-                   f"runtime (received object of type: {type(test_val)})")
-
-        # from init
-        with self.assertRaises(TypeError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "duration": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(TypeError) as err:
-            info.duration = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(TypeError) as err:
-            info["duration"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_duration_negative_interval(self):
-        test_val = timedelta(seconds=-1)
-        self.assertLess(test_val, timedelta())
-        err_msg = (f"[datatube.info.VideoInfo.duration] `duration` must be a "
-                   f"datetime.timedelta object describing the video's total "
-                   f"runtime (duration cannot be negative: {test_val} < "
-                   f"{timedelta()})")
-
-        # from init
-        with self.assertRaises(ValueError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "duration": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(ValueError) as err:
-            info.duration = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(ValueError) as err:
-            info["duration"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_description(self):
-        test_val = "Some Other Description"
-        self.assertNotEqual(test_val, TEST_PROPERTIES["description"])
-
-        # from init
-        info = VideoInfo(**{**TEST_PROPERTIES, "description": test_val})
-        self.assertEqual(info.description, test_val)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        info.description = test_val
-        self.assertEqual(info.description, test_val)
-
-        # from getitem/setitem
-        info = VideoInfo(**TEST_PROPERTIES)
-        info["description"] = test_val
-        self.assertEqual(info["description"], test_val)
-
-    def test_set_description_immutable_instance(self):
-        test_val = "Some Other Description"
-        self.assertNotEqual(test_val, TEST_PROPERTIES["description"])
-        err_msg = ("[datatube.info.VideoInfo.description] cannot reassign "
-                   "`description`: VideoInfo instance is immutable")
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES, immutable=True)
-        with self.assertRaises(AttributeError) as err:
-            info.description = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(AttributeError) as err:
-            info["description"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_description_bad_type(self):
-        test_val = 123
-        self.assertNotIsInstance(test_val, str)
-        err_msg = (f"[datatube.info.VideoInfo.description] `description` must "
-                   f"be a string (received object of type: {type(test_val)})")
-
-        # from init
-        with self.assertRaises(TypeError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "description": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(TypeError) as err:
-            info.description = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_keywords(self):
-        test_val = ("these", "are", "different", "from", "normal")
-        self.assertNotEqual(test_val, TEST_PROPERTIES["keywords"])
-
-        # from init
-        info = VideoInfo(**{**TEST_PROPERTIES, "keywords": test_val})
-        self.assertEqual(info.keywords, test_val)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        info.keywords = test_val
-        self.assertEqual(info.keywords, test_val)
-
-        # from getitem/setitem
-        info = VideoInfo(**TEST_PROPERTIES)
-        info["keywords"] = test_val
-        self.assertEqual(info["keywords"], test_val)
-
-    def test_set_keywords_immutable_instance(self):
-        test_val = ["these", "are", "different", "from", "normal"]
-        self.assertNotEqual(test_val, TEST_PROPERTIES["keywords"])
-        err_msg = ("[datatube.info.VideoInfo.keywords] cannot reassign "
-                   "`keywords`: VideoInfo instance is immutable")
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES, immutable=True)
-        with self.assertRaises(AttributeError) as err:
-            info.keywords = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(AttributeError) as err:
-            info["keywords"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_keywords_bad_type(self):
-        test_val = "does not accept naked strings"
-        self.assertNotIsInstance(test_val, (list, tuple, set))
-        err_msg = (f"[datatube.info.VideoInfo.keywords] `keywords` must be a "
-                   f"list, tuple, or set of keyword strings associated with "
-                   f"this video (received object of type: {type(test_val)})")
-
-        # from init
-        with self.assertRaises(TypeError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "keywords": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(TypeError) as err:
-            info.keywords = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(TypeError) as err:
-            info["keywords"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_keywords_bad_keyword_type(self):
-        test_val = ["fine", "great", 123]
-        self.assertFalse(all(isinstance(k, str) for k in test_val))
-        err_msg = (f"[datatube.info.VideoInfo.keywords] `keywords` must be a "
-                   f"list, tuple, or set of keyword strings associated with "
-                   f"this video (received keyword of type: "
-                   f"{type(test_val[2])})")
-
-        # from init
-        with self.assertRaises(TypeError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "keywords": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(TypeError) as err:
-            info.keywords = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(TypeError) as err:
-            info["keywords"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_keywords_empty_string(self):
-        test_val = ["fine", "great", ""]
-        self.assertFalse(all(test_val))
-        err_msg = (f"[datatube.info.VideoInfo.keywords] `keywords` must be a "
-                   f"list, tuple, or set of keyword strings associated with "
-                   f"this video (received empty keyword at index: 2)")
-
-        # from init
-        with self.assertRaises(ValueError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "keywords": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(ValueError) as err:
-            info.keywords = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(ValueError) as err:
-            info["keywords"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
+        test_val = FUTURE_TIMESTAMP
+        self.assertGreater(test_val, NOW)
+        pattern = error_pattern(FUTURE_ERROR_PREFIX, exact=False)
 
-    def test_set_thumbnail_url(self):
-        test_val = "https://i.kym-cdn.com/entries/icons/mobile/000/023/397/C-658VsXoAo3ovC.jpg"
-        self.assertNotEqual(test_val, TEST_PROPERTIES["thumbnail_url"])
-
-        # from init
-        info = VideoInfo(**{**TEST_PROPERTIES, "thumbnail_url": test_val})
-        self.assertEqual(info.thumbnail_url, test_val)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        info.thumbnail_url = test_val
-        self.assertEqual(info.thumbnail_url, test_val)
-
-        # from getitem/setitem
-        info = VideoInfo(**TEST_PROPERTIES)
-        info["thumbnail_url"] = test_val
-        self.assertEqual(info["thumbnail_url"], test_val)
-
-    def test_set_thumbnail_url_immutable_instance(self):
-        test_val = "https://i.kym-cdn.com/entries/icons/mobile/000/023/397/C-658VsXoAo3ovC.jpg"
-        self.assertNotEqual(test_val, TEST_PROPERTIES["thumbnail_url"])
-        err_msg = ("[datatube.info.VideoInfo.thumbnail_url] cannot reassign "
-                   "`thumbnail_url`: VideoInfo instance is immutable")
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES, immutable=True)
-        with self.assertRaises(AttributeError) as err:
-            info.thumbnail_url = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(AttributeError) as err:
-            info["thumbnail_url"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_thumbnail_url_bad_type(self):
-        test_val = 123
-        self.assertNotIsInstance(test_val, str)
-        err_msg = (f"[datatube.info.VideoInfo.thumbnail_url] `thumbnail_url` "
-                   f"must be a valid url string (received object of type: "
-                   f"{type(test_val)})")
-
-        # from init
-        with self.assertRaises(TypeError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "thumbnail_url": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(TypeError) as err:
-            info.thumbnail_url = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(TypeError) as err:
-            info["thumbnail_url"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-    def test_set_thumbnail_url_not_a_url(self):
-        test_val = "this is not a valid url"
-        self.assertNotEqual(test_val, TEST_PROPERTIES["thumbnail_url"])
-        err_msg = (f"[datatube.info.VideoInfo.thumbnail_url] `thumbnail_url` "
-                   f"must be a valid url string (not a valid url: {test_val})")
-
-        # from init
-        with self.assertRaises(ValueError) as err:
-            VideoInfo(**{**TEST_PROPERTIES, "thumbnail_url": test_val})
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from property getter/setter
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(ValueError) as err:
-            info.thumbnail_url = test_val
-        self.assertEqual(str(err.exception), err_msg)
-
-        # from getitem/setitem
-        with self.assertRaises(ValueError) as err:
-            info["thumbnail_url"] = test_val
-        self.assertEqual(str(err.exception), err_msg)
+        for mode in ACCESS_MODES:
+            with self.subTest(mode=mode):
+                with self.assertRaisesRegex(ValueError, pattern):
+                    assign(mode, "last_updated", test_val)
 
     def test_getitem_key_error(self):
-        test_key = "this key does not exist"
+        test_key = MISSING_KEY
         self.assertNotIn(test_key, TEST_PROPERTIES)
-        err_msg = repr(test_key)
+        pattern = error_pattern(MISSING_KEY_ERROR)
 
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(KeyError) as err:
+        info = BASE_INFO
+        with self.assertRaisesRegex(KeyError, pattern):
             info[test_key]
-        self.assertEqual(str(err.exception), err_msg)
 
     def test_setitem_key_error(self):
-        test_key = "this key does not exist"
+        test_key = MISSING_KEY
         self.assertNotIn(test_key, TEST_PROPERTIES)
-        err_msg = repr(test_key)
+        pattern = error_pattern(MISSING_KEY_ERROR)
 
-        info = VideoInfo(**TEST_PROPERTIES)
-        with self.assertRaises(KeyError) as err:
+        info = copy.copy(BASE_INFO)
+        with self.assertRaisesRegex(KeyError, pattern):
             info[test_key] = "something"
-        self.assertEqual(str(err.exception), err_msg)
 
 
 class VideoInfoIterationTests(unittest.TestCase):
 
+    maxDiff = None
+
     def test_items(self):
-        info = VideoInfo(**TEST_PROPERTIES)
-        self.assertEqual(tuple(info.items()), tuple(EXPECTED_VIDEOINFO.items()))
+        info = BASE_INFO
+        self.assertEqual(tuple(info.items()), EXPECTED_ITEMS)
 
     def test_keys(self):
-        info = VideoInfo(**TEST_PROPERTIES)
-        self.assertEqual(tuple(info.keys()), tuple(EXPECTED_VIDEOINFO.keys()))
+        info = BASE_INFO
+        self.assertEqual(tuple(info.keys()), EXPECTED_KEYS)
 
     def test_values(self):
-        info = VideoInfo(**TEST_PROPERTIES)
-        self.assertEqual(tuple(info.values()),
-                         tuple(EXPECTED_VIDEOINFO.values()))
+        info = BASE_INFO
+        self.assertEqual(tuple(info.values()), EXPECTED_VALUES)
 
     def test_iter(self):
-        info = VideoInfo(**TEST_PROPERTIES)
-        expected = tuple(EXPECTED_VIDEOINFO)
-        for index, key in enumerate(info):
-            self.assertEqual(key, expected[index])
+        info = BASE_INFO
+        self.assertEqual(tuple(info), EXPECTED_KEYS)
 
 
 class VideoInfoDunderTests(unittest.TestCase):
 
+    maxDiff = None
+
     def test_contains(self):
-        info = VideoInfo(**TEST_PROPERTIES)
+        info = BASE_INFO
 
         # True
         for key in EXPECTED_VIDEOINFO:
@@ -1043,117 +348,90 @@ class VideoInfoDunderTests(unittest.TestCase):
         self.assertFalse("" in info)  # empty string
         self.assertFalse("this key does not exist" in info)
 
+    def test_copy(self):
+        # mutable
+        info = copy.copy(BASE_INFO)
+        self.assertIsNot(info, BASE_INFO)
+        self.assertEqual(info, BASE_INFO)
+        self.assertFalse(info.immutable)
+        info.video_title = "Some Other Video Title"
+        self.assertEqual(BASE_INFO.video_title, TEST_PROPERTIES["video_title"])
+
+        # immutable
+        info = copy.copy(IMMUTABLE_INFO)
+        self.assertTrue(info.immutable)
+        with self.assertRaises(AttributeError):
+            info.video_title = "Some Other Video Title"
+
     def test_equality_videoinfo_instances(self):
         # True
-        info1 = VideoInfo(**TEST_PROPERTIES)
+        info1 = BASE_INFO
         info2 = VideoInfo(**TEST_PROPERTIES)
         self.assertEqual(info1, info2)
 
         # False
-        different = {
-            "channel_id": "UC_different_from_info1_",
-            "channel_name": "Some Other Channel Name",
-            "video_id": "_different_",
-            "video_title": "Some Other Video Title",
-            "publish_date": datetime(1950, 1, 1, tzinfo=timezone.utc),
-            "last_updated": datetime.now(timezone.utc),
-            "duration": timedelta(hours=1),
-            "description": "Some Other Description",
-            "keywords": ["foo", "bar", "baz"],
-            "thumbnail_url": "https://i.kym-cdn.com/entries/icons/mobile/000/023/397/C-658VsXoAo3ovC.jpg"
-        }
-        for key, test_val in different.items():
-            self.assertNotEqual(test_val, TEST_PROPERTIES[key])
-            info3 = VideoInfo(**{**TEST_PROPERTIES, key: test_val})
-            self.assertNotEqual(info1, info3)
+        for key, test_val in GOOD_VALUES.items():
+            with self.subTest(key=key):
+                info3 = VideoInfo(**props(**{key: test_val}))
+                self.assertNotEqual(info1, info3)
 
     def test_equality_base_dict(self):
         # True
-        info = VideoInfo(**TEST_PROPERTIES)
+        info = BASE_INFO
         self.assertEqual(info, EXPECTED_VIDEOINFO)
 
         # False - unequal values
-        different = {
-            "channel_id": "UC_different_from_info1_",
-            "channel_name": "Some Other Channel Name",
-            "video_id": "_different_",
-            "video_title": "Some Other Video Title",
-            "publish_date": datetime(1950, 1, 1, tzinfo=timezone.utc),
-            "last_updated": datetime.now(timezone.utc),
-            "duration": timedelta(hours=1),
-            "description": "Some Other Description",
-            "keywords": ["foo", "bar", "baz"],
-            "thumbnail_url": "https://i.kym-cdn.com/entries/icons/mobile/000/023/397/C-658VsXoAo3ovC.jpg"
-        }
-        for key, test_val in different.items():
-            self.assertNotEqual(test_val, TEST_PROPERTIES[key])
-            expected = {**EXPECTED_VIDEOINFO, key: test_val}
-            self.assertNotEqual(info, expected)
+        for key, test_val in GOOD_VALUES.items():
+            with self.subTest(key=key):
+                expected = {**EXPECTED_VIDEOINFO, key: test_val}
+                self.assertNotEqual(info, expected)
 
         # False - missing/extra key
         for key in TEST_PROPERTIES:
-            missing = {k: v for k, v in EXPECTED_VIDEOINFO.items() if k != key}
-            self.assertNotEqual(info, missing)
+            with self.subTest(missing=key):
+                missing = EXPECTED_VIDEOINFO.copy()
+                del missing[key]
+                self.assertNotEqual(info, missing)
         self.assertNotIn("extra key", EXPECTED_VIDEOINFO)
         self.assertNotEqual(info, {**EXPECTED_VIDEOINFO,
                                    "extra key": "some value"})
 
     def test_hash(self):
         # equal values
-        info1 = VideoInfo(**TEST_PROPERTIES, immutable=True)
+        info1 = IMMUTABLE_INFO
         info2 = VideoInfo(**TEST_PROPERTIES, immutable=True)
         self.assertEqual(hash(info1), hash(info2))
 
+        # cached hash survives repeated calls and copies
+        self.assertEqual(hash(info1), hash(info1))
+        self.assertEqual(hash(copy.copy(info1)), hash(info2))
+
         # unequal values
-        different = {
-            "channel_id": "UC_different_from_info1_",
-            "channel_name": "Some Other Channel Name",
-            "video_id": "_different_",
-            "video_title": "Some Other Video Title",
-            "publish_date": datetime(1950, 1, 1, tzinfo=timezone.utc),
-            "last_updated": datetime.now(timezone.utc),
-            "duration": timedelta(hours=1),
-            "description": "Some Other Description",
-            "keywords": ["foo", "bar", "baz"],
-            "thumbnail_url": "https://i.kym-cdn.com/entries/icons/mobile/000/023/397/C-658VsXoAo3ovC.jpg"
-        }
-        for key, test_val in different.items():
-            self.assertNotEqual(test_val, TEST_PROPERTIES[key])
-            info3 = VideoInfo(**{**TEST_PROPERTIES, key: test_val},
-                              immutable=True)
-            self.assertNotEqual(hash(info1), hash(info3))
+        for key, test_val in GOOD_VALUES.items():
+            with self.subTest(key=key):
+                info3 = VideoInfo(**props(**{key: test_val}), immutable=True)
+                self.assertNotEqual(hash(info1), hash(info3))
 
         # instance not immutable
         info4 = VideoInfo(**TEST_PROPERTIES, immutable=False)
-        with self.assertRaises(TypeError) as err:
-            hash(info4)
         err_msg = ("[datatube.info.VideoInfo.__hash__] PropertyDict cannot be "
                    "hashed: instance must be immutable")
-        self.assertEqual(str(err.exception), err_msg)
+        with self.assertRaisesRegex(TypeError, error_pattern(err_msg)):
+            hash(info4)
 
     def test_len(self):
-        info = VideoInfo(**TEST_PROPERTIES)
+        info = BASE_INFO
         self.assertEqual(len(info), len(EXPECTED_VIDEOINFO))
 
     def test_repr(self):
-        fields = {**TEST_PROPERTIES, "immutable": False}
-        str_repr = reprlib.Repr()
-        formatted = []
-        for k, v in fields.items():
-            if isinstance(v, str):
-                formatted.append(f"{k}={str_repr.repr(v)}")
-            else:
-                formatted.append(f"{k}={repr(v)}")
-        expected = f"VideoInfo({', '.join(formatted)})"
-        info = VideoInfo(**TEST_PROPERTIES)
-        self.assertEqual(repr(info), expected)
+        info = BASE_INFO
+        self.assertEqual(repr(info), EXPECTED_REPR)
 
     def test_str(self):
-        info = VideoInfo(**TEST_PROPERTIES)
-        str_repr = reprlib.Repr()
+        info = copy.copy(BASE_INFO)
 
         # short values
-        shortened_url = str_repr.repr(TEST_PROPERTIES["thumbnail_url"])[1:-1]
+        shortened_url = STR_REPR.repr(TEST_PROPERTIES["thumbnail_url"])[1:-1]
         self.assertEqual(str(info), str({**EXPECTED_VIDEOINFO,
                                          "thumbnail_url": shortened_url}))
 
@@ -1183,116 +461,128 @@ class VideoInfoDunderTests(unittest.TestCase):
         for key, val in different.items():
             info[key] = val
             if isinstance(val, str):
-                val = str_repr.repr(val)[1:-1]
+                val = STR_REPR.repr(val)[1:-1]
             expected[key] = val
         self.assertEqual(str(info), str(expected))
 
 
 class VideoInfoJSONTests(unittest.TestCase):
 
+    maxDiff = None
+
     @classmethod
     def setUpClass(cls) -> None:
-        with JSON_PATH.open("w") as json_file:
-            json.dump(EXPECTED_JSON, json_file)
+        # only built when the JSON tests are actually selected.  Each process
+        # gets its own directory, so parallel runs (pytest -n auto) never
+        # read or delete each other's files
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        cls.json_dir = tempfile.TemporaryDirectory(prefix="video_info_",
+                                                   dir=DATA_DIR)
+        cls.json_path = Path(cls.json_dir.name, "test_video_info.json")
+        # an existing file without a .json suffix, for the path errors
+        cls.txt_path = Path(cls.json_dir.name, "test_video_info.json.txt")
+        cls.txt_path.touch()
+        cls.expected_json = {
+            "channel_id": TEST_PROPERTIES["channel_id"],
+            "channel_name": TEST_PROPERTIES["channel_name"],
+            "video_id": TEST_PROPERTIES["video_id"],
+            "video_title": TEST_PROPERTIES["video_title"],
+            "publish_date": TEST_PROPERTIES["publish_date"].isoformat(),
+            "last_updated": TEST_PROPERTIES["last_updated"].isoformat(),
+            "duration": TEST_PROPERTIES["duration"].total_seconds(),
+            "description": TEST_PROPERTIES["description"],
+            "keywords": list(TEST_PROPERTIES["keywords"]),
+            "thumbnail_url": TEST_PROPERTIES["thumbnail_url"]
+        }
+        # serialized once - to_json output is compared against this text
+        cls.expected_text = json.dumps(cls.expected_json)
+        cls.json_path.write_text(cls.expected_text)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.json_dir.cleanup()
 
     def test_from_json(self):
-        info = VideoInfo.from_json(JSON_PATH)
-        self.assertEqual(info.channel_id, TEST_PROPERTIES["channel_id"])
-        self.assertEqual(info.channel_name, TEST_PROPERTIES["channel_name"])
-        self.assertEqual(info.video_id, TEST_PROPERTIES["video_id"])
-        self.assertEqual(info.video_title, TEST_PROPERTIES["video_title"])
-        self.assertEqual(info.publish_date, TEST_PROPERTIES["publish_date"])
-        self.assertEqual(info.last_updated, TEST_PROPERTIES["last_updated"])
-        self.assertEqual(info.duration, TEST_PROPERTIES["duration"])
-        self.assertEqual(info.description, TEST_PROPERTIES["description"])
-        self.assertEqual(info.keywords, TEST_PROPERTIES["keywords"])
-        self.assertEqual(info.thumbnail_url, TEST_PROPERTIES["thumbnail_url"])
+        info = VideoInfo.from_json(self.json_path)
+        self.assertEqual(info, EXPECTED_VIDEOINFO)
 
         # immutable
-        info = VideoInfo.from_json(JSON_PATH, immutable=True)
+        info = VideoInfo.from_json(self.json_path, immutable=True)
         self.assertTrue(info.immutable)
         with self.assertRaises(AttributeError):
             info.video_title = "Some Other Video Title"
 
     def test_to_json(self):
-        info = VideoInfo(**TEST_PROPERTIES)
-        test_path = Path(JSON_PATH.parent, "temp_video_info_to_json.json")
-        test_path.unlink(missing_ok=True)
-        info.to_json(test_path)
-        self.assertTrue(test_path.exists())
-        with test_path.open("r") as json_file:
-            saved = json.load(json_file)
-        self.assertEqual(saved, EXPECTED_JSON)
-        test_path.unlink()
+        info = BASE_INFO
+        test_path = Path(self.json_path.parent, "temp_video_info_to_json.json")
+        self.assertEqual(info.to_json(test_path), self.expected_json)
+        self.assertEqual(test_path.read_text(), self.expected_text)
+
+    def test_to_json_creates_parent(self):
+        test_path = Path(self.json_path.parent, "missing", "nested",
+                         "temp_video_info_to_json.json")
+        self.assertEqual(BASE_INFO.to_json(test_path), self.expected_json)
+        self.assertEqual(test_path.read_text(), self.expected_text)
 
     def test_from_json_errors(self):
         # bad path type
         test_val = 123
         self.assertNotIsInstance(test_val, Path)
-        with self.assertRaises(TypeError) as err:
-            VideoInfo.from_json(test_val)
         err_msg = (f"[datatube.info.VideoInfo.from_json] `json_path` must be "
                    f"Path-like (received object of type: {type(test_val)})")
-        self.assertEqual(str(err.exception), err_msg)
+        with self.assertRaisesRegex(TypeError, error_pattern(err_msg)):
+            VideoInfo.from_json(test_val)
 
         # path does not exist
-        test_val = Path(JSON_PATH.parent, "this_path_does_not_exist.json")
+        test_val = Path(self.json_path.parent, "this_path_does_not_exist.json")
         self.assertFalse(test_val.exists())
-        with self.assertRaises(ValueError) as err:
-            VideoInfo.from_json(test_val)
         err_msg = (f"[datatube.info.VideoInfo.from_json] `json_path` does not "
                    f"exist: {test_val}")
-        self.assertEqual(str(err.exception), err_msg)
+        with self.assertRaisesRegex(ValueError, error_pattern(err_msg)):
+            VideoInfo.from_json(test_val)
 
         # path points to directory
-        test_val = Path(JSON_PATH.parent)
+        test_val = Path(self.json_path.parent)
         self.assertTrue(test_val.is_dir())
-        with self.assertRaises(ValueError) as err:
-            VideoInfo.from_json(test_val)
         err_msg = (f"[datatube.info.VideoInfo.from_json] `json_path` does not "
                    f"point to a .json file: {test_val}")
-        self.assertEqual(str(err.exception), err_msg)
+        with self.assertRaisesRegex(ValueError, error_pattern(err_msg)):
+            VideoInfo.from_json(test_val)
 
         # file does not end in .json
-        test_val = Path(JSON_PATH.parent, f"{JSON_PATH.name}.txt")
+        test_val = self.txt_path
         self.assertNotEqual(test_val.suffix, ".json")
-        test_val.touch()
-        with self.assertRaises(ValueError) as err:
-            VideoInfo.from_json(test_val)
-        test_val.unlink()
         err_msg = (f"[datatube.info.VideoInfo.from_json] `json_path` does not "
                    f"point to a .json file: {test_val}")
-        self.assertEqual(str(err.exception), err_msg)
+        with self.assertRaisesRegex(ValueError, error_pattern(err_msg)):
+            VideoInfo.from_json(test_val)
 
     def test_to_json_errors(self):
-        info = VideoInfo(**TEST_PROPERTIES)
+        info = BASE_INFO
 
         # bad path type
         test_val = 123
         self.assertNotIsInstance(test_val, Path)
-        with self.assertRaises(TypeError) as err:
-            info.to_json(test_val)
         err_msg = (f"[datatube.info.VideoInfo.to_json] `save_to` must be "
                    f"Path-like (received object of type: {type(test_val)})")
-        self.assertEqual(str(err.exception), err_msg)
+        with self.assertRaisesRegex(TypeError, error_pattern(err_msg)):
+            info.to_json(test_val)
 
         # path points to directory
-        test_val = Path(JSON_PATH.parent)
+        test_val = Path(self.json_path.parent)
         self.assertTrue(test_val.is_dir())
-        with self.assertRaises(ValueError) as err:
-            info.to_json(test_val)
         err_msg = (f"[datatube.info.VideoInfo.to_json] `save_to` must end "
                    f"with a .json file extension (received: {test_val})")
-        self.assertEqual(str(err.exception), err_msg)
+        with self.assertRaisesRegex(ValueError, error_pattern(err_msg)):
+            info.to_json(test_val)
 
         # file does not end in .json
-        test_val = Path(JSON_PATH.parent, f"{JSON_PATH.name}.txt")
+        test_val = self.txt_path
         self.assertNotEqual(test_val.suffix, ".json")
-        with self.assertRaises(ValueError) as err:
-            info.to_json(test_val)
         err_msg = (f"[datatube.info.VideoInfo.to_json] `save_to` must end "
                    f"with a .json file extension (received: {test_val})")
-        self.assertEqual(str(err.exception), err_msg)
+        with self.assertRaisesRegex(ValueError, error_pattern(err_msg)):
+            info.to_json(test_val)
 
 
 if __name__ == "__main__":
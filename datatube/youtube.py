@@ -1,11 +1,13 @@
 from __future__ import annotations
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
-from functools import lru_cache
+from functools import lru_cache, partial
+from itertools import islice
 import json
+import os
 from pathlib import Path
-import re
 from socket import gaierror
+import struct
 import subprocess
 from typing import Iterator
 from urllib.error import URLError
@@ -30,7 +32,7 @@ def channel_id_to_url(channel_id: str) -> str:
 
 
 def channel_url_to_id(channel_url: str) -> str:
-    return re.split("/channel/", channel_url)[-1]
+    return channel_url.rpartition("/channel/")[2]
 
 
 def video_id_to_url(video_id: str) -> str:
@@ -38,7 +40,140 @@ def video_id_to_url(video_id: str) -> str:
 
 
 def video_url_to_id(video_url: str) -> str:
-    return re.split("v=", video_url)[-1]
+    # drop trailing query parameters, e.g. "&feature=share"
+    video_id = video_url.rpartition("v=")[2]
+    amp = video_id.find("&")
+    return video_id if amp < 0 else video_id[:amp]
+
+
+# marks a write-once Video field that has not been assigned yet.  Internal
+# only - the getters raise AttributeError rather than return it
+_UNSET = object()
+
+
+# shared by the Channel and Video source setters - formatted once at import
+_SOURCE_ERROR = (f"`source` must be a string with one of the following "
+                 f"values: {repr(AVAILABLE_SOURCES)}")
+
+
+def _crop_list(id_list: list[str], threshold: int = 5) -> str:
+    # only the first few ids are formatted, however long the channel is
+    if len(id_list) > threshold:
+        formatted = "', '".join(id_list[:threshold])
+        return f"['{formatted}', ...]"
+    return repr(id_list)
+
+
+def _crop_str(html_response: str, threshold: int = 16) -> str:
+    # raw html can run to megabytes - never repr the whole response
+    if len(html_response) > threshold:
+        return f"'{html_response[:threshold]}...'"
+    return repr(html_response)
+
+
+def _mp4_duration(path: Path) -> timedelta | None:
+    # read the duration straight out of the movie header (moov/mvhd) rather
+    # than spawning ffprobe.  Returns None if the header is missing, cut
+    # short, or does not state a duration, as can happen in fragmented files
+    with path.open("rb") as mp4_file:
+        try:
+            while True:
+                size, box_type = struct.unpack(">I4s", mp4_file.read(8))
+                if size == 1:  # 64-bit size follows the type
+                    size = struct.unpack(">Q", mp4_file.read(8))[0] - 8
+                if box_type == b"moov":  # descend into the container
+                    continue
+                if box_type == b"mvhd":
+                    if mp4_file.read(1) == b"\x01":  # 64-bit fields
+                        layout = ">3xQQIQ"
+                    else:
+                        layout = ">3xIIII"
+                    header = mp4_file.read(struct.calcsize(layout))
+                    timescale, duration = struct.unpack(layout, header)[2:]
+                    break
+                if size < 8:  # box runs to the end of the file
+                    return None
+                mp4_file.seek(size - 8, os.SEEK_CUR)
+        except struct.error:  # reached end of file
+            return None
+    if not timescale or duration in (0, 2**32 - 1, 2**64 - 1):
+        return None
+    return timedelta(seconds=duration / timescale)
+
+
+def _best_streams(streams: pytube.StreamQuery) -> tuple[pytube.Stream | None,
+                                                        pytube.Stream | None]:
+    # one pass for the highest-resolution adaptive mp4 video and the
+    # highest-bitrate adaptive mp4 audio.  Like pytube's
+    # filter().order_by().desc().first(), values rank by their digits
+    # ("1080p" -> 1080) and ties go to the later stream
+    ranked_by = {"video/mp4": "resolution", "audio/mp4": "abr"}
+    best = {"video/mp4": (-1, None), "audio/mp4": (-1, None)}
+    for stream in streams:
+        attribute = ranked_by.get(stream.mime_type)
+        if attribute is None or not stream.is_adaptive:
+            continue
+        value = getattr(stream, attribute)
+        if value is None:
+            continue
+        rank = int("".join(filter(str.isdigit, value)) or -1)
+        if rank >= best[stream.mime_type][0]:
+            best[stream.mime_type] = (rank, stream)
+    return best["video/mp4"][1], best["audio/mp4"][1]
+
+
+@lru_cache(maxsize=256)
+def _local_response(video_path: Path) -> dict:
+    # info.json is parsed once per path.  As with _pytube_response, only the
+    # data is cached - Video.from_local builds a new Video from it on every
+    # call, around whichever channel the caller passes in
+    return json.loads((video_path / "info.json").read_bytes())
+
+
+@lru_cache(maxsize=256)
+def _pytube_response(video_id: str) -> tuple[str, dict]:
+    # one round trip per video id.  Only the fetched fields are cached -
+    # Video._from_pytube builds a new Video from them on every call, so the
+    # owning channel and target_dir always come from the caller
+    yt = pytube.YouTube(video_id_to_url(video_id))
+    fields = {
+        "video_title": yt.title,
+        "publish_date": yt.publish_date,
+        "last_updated": datetime.now(),
+        "duration": timedelta(seconds=yt.length),
+        "views": yt.views,
+        "rating": yt.rating,
+        "description": yt.description,
+        "keywords": yt.keywords,
+        "thumbnail_url": yt.thumbnail_url,
+        "streams": yt.streams,
+        "captions": yt.captions
+    }
+    return yt.channel_id, fields
+
+
+def _load_local_video(channel: Channel, video_id: str) -> Video:
+    # `/` appends one part to an already-parsed Path, about half the cost of
+    # re-parsing every segment with Path(...)
+    return Video.from_local(channel.target_dir / video_id, channel=channel)
+
+
+def _load_pytube_video(channel: Channel, video_id: str) -> Video:
+    # ids were validated by the video_ids setter - skip from_pytube's url
+    # checks and go straight to the id-keyed fetch
+    return Video._from_pytube(video_id, channel=channel)
+
+
+def _load_sql_video(channel: Channel, video_id: str) -> Video:
+    return Video.from_sql(video_id, channel=channel)
+
+
+# how each source in AVAILABLE_SOURCES turns a channel's video id into a Video
+_VIDEO_LOADERS = {
+    "local": _load_local_video,
+    "pytube": _load_pytube_video,
+    "sql": _load_sql_video
+}
 
 
 class Channel:
@@ -86,10 +221,13 @@ class Channel:
                        f"exist, is not a directory, or has no info.json file: "
                        f"{channel_path}")
             raise ValueError(err_msg)
-        with Path(channel_path, "info.json").open("r") as info_file:
-            saved = json.load(info_file)
-        dir_contents = tqdm(channel_path.iterdir(), leave=False)
-        video_ids = {d.name: d for d in dir_contents if check.is_readable(d)}
+        saved = json.loads((channel_path / "info.json").read_bytes())
+        # DirEntry.is_dir() answers from the directory listing itself, so
+        # only subdirectories cost a stat for their info.json.  __iter__
+        # rebuilds each video's path from target_dir, so names are enough
+        with os.scandir(channel_path) as entries:
+            video_ids = [e.name for e in entries
+                         if e.is_dir() and check.is_readable(Path(e.path))]
         return cls(source="local",
                    channel_id=saved["id"],
                    channel_name=saved["name"],
@@ -208,9 +346,7 @@ class Channel:
                        f"outside of init.  Construct a new Channel object "
                        f"instead")
             raise AttributeError(err_msg)
-        err_msg = (f"`source` must be a string with one of the following "
-                   f"values: {repr(AVAILABLE_SOURCES)}")
-        self._source = check.source(new_source, err_msg)
+        self._source = check.source(new_source, _SOURCE_ERROR)
 
     @property
     def target_dir(self) -> Path:
@@ -232,6 +368,8 @@ class Channel:
         err_msg = ("`video_ids` must be a list, tuple, or set of 11-character "
                    "video ids used by the YouTube backend to track videos")
         self._video_ids = check.video_id_list(new_ids, err_msg)
+        # hashed mirror for O(1) membership - the list keeps fetch order
+        self._video_id_set = frozenset(self._video_ids)
 
     @property
     def workers(self) -> int:
@@ -278,12 +416,27 @@ class Channel:
                 if in_date_range(video):
                     dispatch(video)
         else:
+            def report(futures):
+                for future in futures:
+                    exc = future.exception()
+                    if exc is not None:
+                        print(exc)
+
             with ThreadPoolExecutor(max_workers=self.workers) as executor:
                 try:
-                    futures = []
+                    # like __iter__, keep only a couple of downloads queued
+                    # per worker, and report failures as they complete
+                    window = 2 * (self.workers or 32)
+                    pending = set()
                     for video in self.__iter__():
-                        if in_date_range(video):
-                            futures.append(dispatch(video))
+                        if not in_date_range(video):
+                            continue
+                        if len(pending) >= window:
+                            done, pending = wait(pending,
+                                                 return_when=FIRST_COMPLETED)
+                            report(done)
+                        pending.add(dispatch(video, executor))
+                    report(wait(pending).done)
                 except (KeyboardInterrupt, SystemExit) as exc:
                     print("Received kill signal.  Shutting down threads...")
                     executor.shutdown(cancel_futures=True)
@@ -307,10 +460,12 @@ class Channel:
                 err_msg = (f"[{error_trace()}] `json_path` must end with "
                            f"must end with '.json' extension: {json_path}")
                 raise ValueError(err_msg)
-            json_path.parent.mkdir(parents=True, exist_ok=True)
-            with json_path.open("w") as json_file:
-                json_path.parent.mkdir(exist_ok=True)
-                json.dump(result, json_file)
+            text = json.dumps(result)
+            try:
+                json_path.write_text(text)
+            except FileNotFoundError:  # parent directory is missing
+                json_path.parent.mkdir(parents=True, exist_ok=True)
+                json_path.write_text(text)
         return result
 
     ####################################
@@ -319,40 +474,27 @@ class Channel:
 
     def __contains__(self, video: Video | str) -> bool:
         if isinstance(video, str):
-            return video in self.video_ids
-        return video.id in self.video_ids
+            return video in self._video_id_set
+        return video.id in self._video_id_set
 
     def __eq__(self, other: Channel) -> bool:
+        if not isinstance(other, Channel):
+            return NotImplemented
         return self.id == other.id and self.last_updated == other.last_updated
 
     def __hash__(self) -> int:
-        return hash(id(self))
+        # id and last_updated are fixed at init, like the fields __eq__ uses
+        return hash((self.id, self.last_updated))
 
     def __iter__(self) -> Iterator[Video]:
-        # define dispatch functions
-        if self.source == "local":
-            def dispatch(video_id, executor=None):
-                path = Path(self.target_dir, video_id)
-                if executor is None:
-                    return Video.from_local(path, channel=self)
-                return executor.submit(Video.from_local, path, channel=self)
-        elif self.source == "pytube":
-            def dispatch(video_id, executor=None):
-                url = video_id_to_url(video_id)
-                if executor is None:
-                    return Video.from_pytube(url, channel=self)
-                return executor.submit(Video.from_pytube, url, channel=self)
-        elif self.source == "sql":
-            def dispatch(video_id, executor=None):
-                if executor is None:
-                    return Video.from_sql(video_id, channel=self)
-                return executor.submit(Video.from_sql, video_id, channel=self)
+        # source is fixed at init, so the loader is a plain table lookup
+        load = partial(_VIDEO_LOADERS[self.source], self)
 
         # perform iteration
         if self.workers is not None and self.workers == 1:
             for v_id in self.video_ids:
                 try:
-                    yield dispatch(v_id)
+                    yield load(v_id)
                 except (KeyboardInterrupt, SystemExit):
                     raise
                 except Exception as exc:
@@ -361,13 +503,24 @@ class Channel:
         else:
             with ThreadPoolExecutor(max_workers=self.workers) as executor:
                 try:
-                    fs = [dispatch(v_id, executor) for v_id in self.video_ids]
-                    for future in as_completed(fs):
-                        exc = future.exception()
-                        if exc is not None:
-                            print(exc)
-                            continue
-                        yield future.result()
+                    # admit a couple of requests per worker at a time rather
+                    # than queueing the whole channel against youtube.com
+                    # up front - the pool size is the per-host limit
+                    ids = iter(self.video_ids)
+                    window = 2 * (self.workers or 32)
+                    pending = {executor.submit(load, v_id)
+                               for v_id in islice(ids, window)}
+                    while pending:
+                        done, pending = wait(pending,
+                                             return_when=FIRST_COMPLETED)
+                        for v_id in islice(ids, len(done)):
+                            pending.add(executor.submit(load, v_id))
+                        for future in done:
+                            exc = future.exception()
+                            if exc is not None:
+                                print(exc)
+                                continue
+                            yield future.result()
                 except (KeyboardInterrupt, SystemExit) as exc:
                     print("Received kill signal.  Shutting down threads...")
                     executor.shutdown(cancel_futures=True)
@@ -377,28 +530,17 @@ class Channel:
         return len(self.video_ids)
 
     def __repr__(self) -> str:
-        def crop_contents(id_list: list[str], threshold: int = 5) -> str:
-            if len(id_list) > threshold:
-                formatted = "', '".join(id_list[:threshold])
-                return f"['{formatted}', ...]"
-            return repr(id_list)
-
-        def crop_html(html_response: str, threshold: int = 16) -> str:
-            if len(html_response) > threshold:
-                return f"'{html_response[:threshold]}...'"
-            return repr(html_response)
-
         prop_dict = {
             "source": repr(self.source),
             "channel_id": repr(self.id),
             "channel_name": repr(self.name),
             "last_updated": repr(self.last_updated),
-            "video_ids": crop_contents(self.video_ids),
+            "video_ids": _crop_list(self.video_ids),
             "target_dir": repr(self.target_dir),
-            "about_html": crop_html(self.html["about"]),
-            "community_html": crop_html(self.html["community"]),
-            "featured_channels_html": crop_html(self.html["featured_channels"]),
-            "videos_html": crop_html(self.html["videos"]),
+            "about_html": _crop_str(self.html["about"]),
+            "community_html": _crop_str(self.html["community"]),
+            "featured_channels_html": _crop_str(self.html["featured_channels"]),
+            "videos_html": _crop_str(self.html["videos"]),
             "workers": repr(self.workers)
         }
         formatted = [f"{k}={v}" for k, v in prop_dict.items()]
@@ -411,6 +553,13 @@ class Channel:
 
 class Video:
 
+    # every backing field the properties below assign, plus the VideoInfo
+    # record - no per-instance __dict__
+    __slots__ = ("_captions", "_channel", "_description",
+                 "_download_check", "_duration", "_id", "_info", "_keywords",
+                 "_last_updated", "_publish_date", "_source", "_stats",
+                 "_streams", "_target_dir", "_thumbnail_url", "_title")
+
     def __init__(self,
                  source: str,
                  info: VideoInfo,
@@ -422,22 +571,23 @@ class Video:
                  streams: pytube.StreamQuery | None = None,
                  captions: pytube.CaptionQuery | None = None,
                  channel: Channel | None = None):
+        # an identity check on a preset slot is far cheaper than hasattr(),
+        # which raises and swallows AttributeError for an empty slot
+        self._id = self._info = self._last_updated = self._source = _UNSET
+        self._streams = self._captions = _UNSET
+        self._download_check = None  # see is_downloaded()
         self.source = source
         self.info = info
-        stats_dict = {
-            "views": views,
-            "rating": rating,
-            "likes": likes,
-            "dislikes": dislikes
-        }
-        self.stats = {k: v for k, v in stats_dict.items() if v is not None}
+        stats = (("views", views), ("rating", rating), ("likes", likes),
+                 ("dislikes", dislikes))
+        self.stats = {k: v for k, v in stats if v is not None}
         self.channel = channel
         self.streams = streams
         self.captions = captions
         if target_dir is not None:
             self.target_dir = target_dir
         elif self.channel is not None:
-            self.target_dir = Path(self.channel.target_dir, self.id)
+            self.target_dir = self.channel.target_dir / self.id
         else:
             self._target_dir = None  # naked pytube video
 
@@ -446,7 +596,6 @@ class Video:
     #############################
 
     @classmethod
-    @lru_cache(maxsize=256)
     def from_local(cls,
                    video_path: Path,
                    channel: Channel | None = None) -> Video:
@@ -465,8 +614,7 @@ class Video:
             err_msg = (f"[{error_trace(cls)}] `channel` must be an instance "
                        f"of Channel (received object of type: {type(channel)})")
             raise TypeError(err_msg)
-        with Path(video_path, "info.json").open("r") as info_file:
-            saved = json.load(info_file)
+        saved = _local_response(video_path)
         result = cls(source="local",
                      video_id=saved["id"],
                      video_title=saved["title"],
@@ -478,7 +626,7 @@ class Video:
                      likes=None,
                      dislikes=None,
                      description=saved["description"],
-                     keywords=saved["keywords"],
+                     keywords=list(saved["keywords"]),  # not the cached list
                      thumbnail_url=saved["thumbnail_url"],
                      target_dir=video_path,
                      streams=None,
@@ -491,7 +639,6 @@ class Video:
         return result
 
     @classmethod
-    @lru_cache(maxsize=256)
     def from_pytube(cls,
                     video_url: str,
                     channel: Channel | None = None) -> Video:
@@ -507,30 +654,29 @@ class Video:
             err_msg = (f"[{error_trace(cls)}] `channel` must be an instance "
                        f"of Channel (received object of type: {type(channel)})")
             raise TypeError(err_msg)
+        # the response is memoized on the video id, so the same video reached
+        # through differently-decorated urls (e.g. "&feature=share") is
+        # fetched once
+        return cls._from_pytube(video_url_to_id(video_url), channel)
+
+    @classmethod
+    def _from_pytube(cls,
+                     video_id: str,
+                     channel: Channel | None = None) -> Video:
+        video_url = video_id_to_url(video_id)
         try:
-            yt = pytube.YouTube(video_url)
-            video_id = video_url_to_id(video_url)
+            yt_channel_id, fields = _pytube_response(video_id)
             if channel is not None:
-                target_dir = Path(channel.target_dir, video_id)
+                target_dir = channel.target_dir / video_id
             else:
-                target_dir = Path(VIDEO_DIR, yt.channel_id, video_id)
+                target_dir = VIDEO_DIR / yt_channel_id / video_id
             result = cls(source="pytube",
                          video_id=video_id,
-                         video_title=yt.title,
-                         publish_date=yt.publish_date,
-                         last_updated=datetime.now(),
-                         duration=timedelta(seconds=yt.length),
-                         views=yt.views,
-                         rating=yt.rating,
                          likes=None,
                          dislikes=None,
-                         description=yt.description,
-                         keywords=yt.keywords,
-                         thumbnail_url=yt.thumbnail_url,
                          target_dir=target_dir,
-                         streams=yt.streams,
-                         captions=yt.captions,
-                         channel=channel)
+                         channel=channel,
+                         **fields)
         except (pytube.exceptions.AgeRestrictedError,
                 pytube.exceptions.MembersOnly,
                 pytube.exceptions.VideoPrivate,
@@ -567,21 +713,23 @@ class Video:
 
     @property
     def captions(self) -> pytube.CaptionQuery:
+        if self._captions is _UNSET:
+            err_msg = f"[{error_trace()}] `captions` has not been set"
+            raise AttributeError(err_msg)
         return self._captions
 
     @captions.setter
     def captions(self, new_captions: pytube.CaptionQuery | None) -> None:
-        if hasattr(self, "_captions"):
+        if self._captions is not _UNSET:
             err_msg = (f"[{error_trace()}] `captions` cannot be changed "
                        f"outside of init")
             raise AttributeError(err_msg)
         if new_captions is not None:
-            trace = f"[{error_trace()}]"
             err_msg = ("`captions` must be a pytube.CaptionQuery object or "
                        "None if the video has no captions")
             if not isinstance(new_captions, pytube.CaptionQuery):
                 context = f"(received object of type: {type(new_captions)})"
-                raise TypeError(f"{trace} {err_msg} {context}")
+                raise TypeError(f"[{error_trace()}] {err_msg} {context}")
             self._captions = new_captions
         else:
             self._captions = pytube.CaptionQuery([])
@@ -592,22 +740,17 @@ class Video:
 
     @channel.setter
     def channel(self, new_channel: Channel | None) -> None:
-        err_msg = (f"[{error_trace()}] `channel` must be a Channel object "
-                   f"pointing to the owner of this video")
+        err_msg = ("`channel` must be a Channel object pointing to the owner "
+                   "of this video")
         if new_channel is not None:
             if not isinstance(new_channel, Channel):
                 context = f"(received object of type: {type(new_channel)})"
-                raise TypeError(f"{err_msg} {context}")
-            if self.id not in new_channel.video_ids:
-                if len(new_channel.video_ids) > 5:
-                    cropped = "', '".join(new_channel.video_ids[:5])
-                    context = (f"(channel does not own this video: "
-                               f"{repr(self.id)} not in ['{cropped}', ...])")
-                else:
-                    context = (f"(channel does not own this video: "
-                               f"{repr(self.id)} not in "
-                               f"{repr(new_channel.video_ids)})")
-                raise ValueError(f"{err_msg} {context}")
+                raise TypeError(f"[{error_trace()}] {err_msg} {context}")
+            if self.id not in new_channel:
+                context = (f"(channel does not own this video: "
+                           f"{repr(self.id)} not in "
+                           f"{_crop_list(new_channel.video_ids)})")
+                raise ValueError(f"[{error_trace()}] {err_msg} {context}")
         self._channel = new_channel
 
     @property
@@ -616,12 +759,11 @@ class Video:
 
     @description.setter
     def description(self, new_description: str) -> None:
-        trace = f"[{error_trace()}]"
         err_msg = ("`description` must be a string containing the video's "
                    "description")
         if not isinstance(new_description, str):
             context = f"(received object of type: {type(new_description)})"
-            raise TypeError(f"{trace} {err_msg} {context}")
+            raise TypeError(f"[{error_trace()}] {err_msg} {context}")
         self._description = new_description
 
     @property
@@ -636,11 +778,14 @@ class Video:
 
     @property
     def id(self) -> str:
+        if self._id is _UNSET:
+            err_msg = f"[{error_trace()}] `id` has not been set"
+            raise AttributeError(err_msg)
         return self._id
 
     @id.setter
     def id(self, new_id: str) -> None:
-        if hasattr(self, "_id"):
+        if self._id is not _UNSET:
             err_msg = (f"[{error_trace()}] `id` cannot be changed outside "
                        f"of init")
             raise AttributeError(err_msg)
@@ -648,33 +793,56 @@ class Video:
                    "YouTube backend to track videos")
         self._id = check.video_id(new_id, err_msg)
 
+    @property
+    def info(self) -> VideoInfo:
+        if self._info is _UNSET:
+            err_msg = f"[{error_trace()}] `info` has not been set"
+            raise AttributeError(err_msg)
+        return self._info
+
+    @info.setter
+    def info(self, new_info: VideoInfo) -> None:
+        # __hash__ reads this record, so it can't be swapped out afterwards
+        if self._info is not _UNSET:
+            err_msg = (f"[{error_trace()}] `info` cannot be changed outside "
+                       f"of init")
+            raise AttributeError(err_msg)
+        if not isinstance(new_info, VideoInfo):
+            err_msg = (f"[{error_trace()}] `info` must be a VideoInfo "
+                       f"record (received object of type: {type(new_info)})")
+            raise TypeError(err_msg)
+        self._info = new_info
+
     @property
     def keywords(self) -> list[str]:
         return self._keywords
 
     @keywords.setter
     def keywords(self, new_keywords: list[str] | tuple[str] | set[str]) -> None:
-        err_msg = (f"[{error_trace()}] `keywords` must be a list, tuple, "
-                   f"or set of keyword strings associated with this video")
+        err_msg = ("`keywords` must be a list, tuple, or set of keyword "
+                   "strings associated with this video")
         if not isinstance(new_keywords, (list, tuple, set)):
             context = f"(received object of type: {type(new_keywords)})"
-            raise TypeError(f"{err_msg} {context}")
+            raise TypeError(f"[{error_trace()}] {err_msg} {context}")
         for keyword in new_keywords:
             if not isinstance(keyword, str):
                 context = f"(received keyword of type: {type(keyword)})"
-                raise TypeError(f"{err_msg} {context}")
+                raise TypeError(f"[{error_trace()}] {err_msg} {context}")
             if not keyword:  # keyword is empty string
                 context = f"(received empty keyword: {repr(keyword)})"
-                raise ValueError(f"{err_msg} {context}")
+                raise ValueError(f"[{error_trace()}] {err_msg} {context}")
         self._keywords = new_keywords
 
     @property
     def last_updated(self) -> datetime:
+        if self._last_updated is _UNSET:
+            err_msg = f"[{error_trace()}] `last_updated` has not been set"
+            raise AttributeError(err_msg)
         return self._last_updated
 
     @last_updated.setter
     def last_updated(self, new_date: datetime) -> None:
-        if hasattr(self, "_last_updated"):
+        if self._last_updated is not _UNSET:
             err_msg = (f"[{error_trace()}] `last_updated` cannot be "
                        f"changed outside of init")
             raise AttributeError(err_msg)
@@ -695,18 +863,19 @@ class Video:
 
     @property
     def source(self) -> str:
+        if self._source is _UNSET:
+            err_msg = f"[{error_trace()}] `source` has not been set"
+            raise AttributeError(err_msg)
         return self._source
 
     @source.setter
     def source(self, new_source: str) -> None:
-        if hasattr(self, "_source"):
+        if self._source is not _UNSET:
             err_msg = (f"[{error_trace()}] `source` cannot be changed "
                        f"outside of init.  Construct a new Video object "
                        f"instead")
             raise AttributeError(err_msg)
-        err_msg = (f"`source` must be a string with one of the following "
-                   f"values: {repr(AVAILABLE_SOURCES)}")
-        self._source = check.source(new_source, err_msg)
+        self._source = check.source(new_source, _SOURCE_ERROR)
 
     @property
     def stats(self) -> dict[str, int | float]:
@@ -714,11 +883,11 @@ class Video:
 
     @stats.setter
     def stats(self, new_stats: dict[str, int | float]) -> None:
-        err_msg = (f"[{error_trace()}] `stats` must be a dictionary "
-                   f"containing the view and rating statistics of the video")
+        err_msg = ("`stats` must be a dictionary containing the view and "
+                   "rating statistics of the video")
         if not isinstance(new_stats, dict):
             context = f"(received object of type: {type(new_stats)})"
-            raise TypeError(f"{err_msg} {context}")
+            raise TypeError(f"[{error_trace()}] {err_msg} {context}")
         # if ("rating" not in new_stats and
         #     ("likes" not in new_stats or "dislikes" not in new_stats)):
         #     context = ("(not enough information to compute rating: no "
@@ -728,27 +897,27 @@ class Video:
         for k, v in new_stats.items():
             if not isinstance(k, str):
                 context = f"(received non-string key of type: {type(k)})"
-                raise TypeError(f"{err_msg} {context}")
-            if k not in {"views", "rating", "likes", "dislikes"}:
-                context = f"(received unexpected key: {repr(k)})"
-                raise ValueError(f"{err_msg} {context}")
+                raise TypeError(f"[{error_trace()}] {err_msg} {context}")
             if k == "rating":
                 if not isinstance(v, (int, float)):
                     context = (f"('rating' must be an integer or float, "
                                f"received object of type: {type(v)})")
-                    raise TypeError(f"{err_msg} {context}")
+                    raise TypeError(f"[{error_trace()}] {err_msg} {context}")
                 if not 0 <= v <= 5:
                     context = (f"('rating' must be between 0 and 5, received: "
                                f"{v})")
-                    raise ValueError(f"{err_msg} {context}")
-            elif k in ["views", "likes", "dislikes"]:
+                    raise ValueError(f"[{error_trace()}] {err_msg} {context}")
+            elif k in {"views", "likes", "dislikes"}:  # a frozenset constant
                 if not isinstance(v, int):
                     context = (f"({repr(k)} must be an integer, received "
                                f"object of type: {type(v)})")
-                    raise TypeError(f"{err_msg} {context}")
+                    raise TypeError(f"[{error_trace()}] {err_msg} {context}")
                 if v < 0:
                     context = f"({repr(k)} must be >= 0, received: {v})"
-                    raise ValueError(f"{err_msg} {context}")
+                    raise ValueError(f"[{error_trace()}] {err_msg} {context}")
+            else:  # the branches above cover every accepted key
+                context = f"(received unexpected key: {repr(k)})"
+                raise ValueError(f"[{error_trace()}] {err_msg} {context}")
         if ("rating" not in new_stats and
             ("likes" in new_stats and "dislikes" in new_stats)):
             likes = new_stats["likes"]
@@ -758,21 +927,23 @@ class Video:
 
     @property
     def streams(self) -> pytube.StreamQuery:
+        if self._streams is _UNSET:
+            err_msg = f"[{error_trace()}] `streams` has not been set"
+            raise AttributeError(err_msg)
         return self._streams
 
     @streams.setter
     def streams(self, new_streams: pytube.StreamQuery | None) -> None:
-        if hasattr(self, "_streams"):
+        if self._streams is not _UNSET:
             err_msg = (f"[{error_trace()}] `streams` cannot be changed "
                        f"outside of init")
             raise AttributeError(err_msg)
         if new_streams is not None:
-            err_msg = (f"[{error_trace()}] `streams` must be a "
-                       f"pytube.StreamQuery object or None if the video has "
-                       f"no streams")
+            err_msg = ("`streams` must be a pytube.StreamQuery object or "
+                       "None if the video has no streams")
             if not isinstance(new_streams, pytube.StreamQuery):
                 context = f"(received object of type: {type(new_streams)})"
-                raise TypeError(f"{err_msg} {context}")
+                raise TypeError(f"[{error_trace()}] {err_msg} {context}")
             self._streams = new_streams
         else:
             self._streams = pytube.StreamQuery([])
@@ -794,12 +965,11 @@ class Video:
 
     @thumbnail_url.setter
     def thumbnail_url(self, new_url: str) -> str:
-        err_msg = (f"[{error_trace()}] `thumbnail_url` must be a url "
-                   f"string pointing to the thumbnail image used for this "
-                   f"video")
+        err_msg = ("`thumbnail_url` must be a url string pointing to the "
+                   "thumbnail image used for this video")
         if not isinstance(new_url, str):
             context = f"(received object of type: {type(new_url)})"
-            raise TypeError(f"{err_msg} {context}")
+            raise TypeError(f"[{error_trace()}] {err_msg} {context}")
         self._thumbnail_url = new_url
 
     @property
@@ -842,56 +1012,82 @@ class Video:
 
         if verbose:
             print(f"[{self.publish_date.date()}] {self.title}")
-        self.target_dir.mkdir(parents=True, exist_ok=True)
-        self.to_json(Path(self.target_dir, "info.json"))
-        self.stats.to_csv(Path(self.target_dir, "stats.csv"))
-        audio_path = Path(self.target_dir, f"[audio] {self.id}.mp4")
-        video_path = Path(self.target_dir, f"[video] {self.id}.mp4")
-        captions_path = Path(self.target_dir,
-                             f"[captions] ({caption_language}) {self.id}.srt")
+        target_dir = self.target_dir
+        target_dir.mkdir(parents=True, exist_ok=True)
+        self.to_json(target_dir / "info.json")
+        self.stats.to_csv(target_dir / "stats.csv")
+        # pytube takes a directory and a file name - no need to build full
+        # paths just to split them apart again
+        audio_name = f"[audio] {self.id}.mp4"
+        video_name = f"[video] {self.id}.mp4"
+        captions_name = f"[captions] ({caption_language}) {self.id}.srt"
 
         if not dry_run and not self.is_downloaded():
-            self.streams.filter(adaptive=True, mime_type="video/mp4") \
-                        .order_by("resolution") \
-                        .desc() \
-                        .first() \
-                        .download(output_path=video_path.parent,
-                                  filename=video_path.name,
-                                  timeout=timeout,
-                                  max_retries=max_retries)
-            self.streams.filter(adaptive=True, mime_type="audio/mp4") \
-                        .order_by("abr") \
-                        .desc() \
-                        .first() \
-                        .download(output_path=audio_path.parent,
-                                  filename=audio_path.name,
-                                  timeout=timeout,
-                                  max_retries=max_retries)
+            video_stream, audio_stream = _best_streams(self.streams)
             caption_track = self.captions.get_by_language_code(caption_language)
-            if caption_track is not None:
-                caption_track.download(output_path=captions_path.parent,
-                                       title=captions_path.name,
-                                       srt=True)
+            # independent transfers - overlap them rather than wait on each
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [
+                    executor.submit(video_stream.download,
+                                    output_path=target_dir,
+                                    filename=video_name,
+                                    timeout=timeout,
+                                    max_retries=max_retries),
+                    executor.submit(audio_stream.download,
+                                    output_path=target_dir,
+                                    filename=audio_name,
+                                    timeout=timeout,
+                                    max_retries=max_retries)
+                ]
+                if caption_track is not None:
+                    futures.append(
+                        executor.submit(caption_track.download,
+                                        output_path=target_dir,
+                                        title=captions_name,
+                                        srt=True)
+                    )
+                for future in futures:
+                    future.result()  # re-raise the first failed transfer
+            self._download_check = None
 
     def is_downloaded(self, tolerance: int | float = 1):
-        def duration(path):
+        def probe(path):
             cmd = ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
                    '-of', 'default=noprint_wrappers=1:nokey=1', str(path)]
-            result = subprocess.run(cmd,
+            return subprocess.Popen(cmd,
                                     stdout=subprocess.PIPE,
-                                    stderr=subprocess.STDOUT,
-                                    check=True)
-            return timedelta(seconds=float(result.stdout))
-
-        audio_path = Path(self.target_dir, f"[audio] {self.id}.mp4")
-        video_path = Path(self.target_dir, f"[video] {self.id}.mp4")
-        if any(not p.exists() for p in [audio_path, video_path]):
+                                    stderr=subprocess.STDOUT)
+
+        def duration(process):
+            stdout, _ = process.communicate()
+            if process.returncode:
+                raise subprocess.CalledProcessError(process.returncode,
+                                                    process.args,
+                                                    output=stdout)
+            return timedelta(seconds=float(stdout))
+
+        audio_path = self.target_dir / f"[audio] {self.id}.mp4"
+        video_path = self.target_dir / f"[video] {self.id}.mp4"
+        try:
+            key = (audio_path, audio_path.stat().st_mtime_ns,
+                   video_path.stat().st_mtime_ns, self.duration, tolerance)
+        except OSError:  # either file is missing
             return False
-        audio_duration = duration(audio_path)
-        video_duration = duration(video_path)
+        # ffprobe is only rerun if either file was touched since last time
+        if self._download_check is not None and self._download_check[0] == key:
+            return self._download_check[1]
+        audio_duration = _mp4_duration(audio_path)
+        video_duration = _mp4_duration(video_path)
+        if audio_duration is None or video_duration is None:
+            # the probes are independent - start both before waiting on either
+            with probe(audio_path) as audio, probe(video_path) as video:
+                audio_duration = duration(audio)
+                video_duration = duration(video)
         min_diff = timedelta(seconds=tolerance)
-        return (abs(audio_duration - self.duration) < min_diff and
-                abs(video_duration - self.duration) < min_diff)
+        result = (abs(audio_duration - self.duration) < min_diff and
+                  abs(video_duration - self.duration) < min_diff)
+        self._download_check = (key, result)
+        return result
 
     def to_json(self, json_path: Path = None) -> dict[str, str]:
         result = {
@@ -916,10 +1112,14 @@ class Video:
                 err_msg = (f"[{error_trace()}] `json_path` must end with "
                            f"must end with '.json' extension: {json_path}")
                 raise ValueError(err_msg)
-            json_path.parent.mkdir(parents=True, exist_ok=True)
-            with json_path.open("w") as json_file:
-                json_path.parent.mkdir(exist_ok=True)
-                json.dump(result, json_file)
+            # dumps() takes the C encoder's one-shot path; dump() streams
+            # chunks from the pure-Python iterencode() into the file
+            text = json.dumps(result)
+            try:
+                json_path.write_text(text)
+            except FileNotFoundError:  # parent directory is missing
+                json_path.parent.mkdir(parents=True, exist_ok=True)
+                json_path.write_text(text)
         return result
 
     ####################################
@@ -927,7 +1127,17 @@ class Video:
     ####################################
 
     def __eq__(self, other: Video) -> bool:
-        return self.id == other.id and self.last_updated == other.last_updated
+        if not isinstance(other, Video):
+            return NotImplemented
+        # compare on the VideoInfo record, which __init__ always populates
+        return (self.info.video_id == other.info.video_id and
+                self.info.last_updated == other.info.last_updated)
 
-    def __hash__(self):
-        return hash(id(self))
+    def __hash__(self) -> int:
+        # a mutable record could change under a set or dict key
+        if not self.info.immutable:
+            err_msg = (f"[{error_trace()}] Video cannot be hashed: `info` "
+                       f"must be immutable")
+            raise TypeError(err_msg)
+        # consistent with __eq__ - the same two VideoInfo fields
+        return hash((self.info.video_id, self.info.last_updated))